@@ -7,29 +7,351 @@ All GPX files will be synchronized so that they all reach the specified alignmen
 at the same time.
 
 Requirements:
-    pip install gpxpy
+    pip install gpxpy  (not needed when numpy and lxml are installed)
+    pip install numpy  (optional, speeds up the distance search)
+    pip install numba  (optional, compiles the distance search)
+    pip install lxml   (optional, streams GPX files during analysis)
 
 Usage:
-    python gpx_aligner.py
+    python gpx_aligner.py [--low-memory] [--workers N] [--precision-threshold M]
+                          [--engine {fast,gpxpy}]
 """
 
+import argparse
+import hashlib
 import os
-import sys
-import glob
-from datetime import datetime, timedelta
-from typing import List, Tuple, Optional
+import re
+import shelve
+import shutil
+import importlib.util
+import multiprocessing
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import List, Tuple, Optional, Union
 import math
 
 try:
-    import gpxpy
-    import gpxpy.gpx
+    import numpy as np
 except ImportError:
-    print("Error: gpxpy library is required. Install it with: pip install gpxpy")
-    sys.exit(1)
+    np = None
+
+try:
+    from numba import config as numba_config, njit, prange, get_num_threads, set_num_threads
+except ImportError:
+    njit = None
+    prange = range
+else:
+    # Numba's TBB threading layer hangs the interpreter at exit when it was started in a
+    # thread other than the main one (the GUI's alignment thread) or before forking
+    # worker processes. The workqueue layer has neither problem, and the parallel kernel
+    # is never entered from two threads at once
+    if numba_config.THREADING_LAYER == 'default':
+        numba_config.THREADING_LAYER = 'workqueue'
+
+try:
+    from lxml import etree
+except ImportError:
+    etree = None
+
+# Parser shared by every lxml parse: GPX files need neither entity expansion nor
+# network access, so both are switched off
+_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True) if etree is not None else None
+
+# <time> elements in raw GPX bytes; re.split() with it yields the text between them and,
+# at every fourth position starting from 2, the timestamp texts
+_TIME_ELEMENT_RE = re.compile(rb'(<time>)([^<]*)(</time>)')
+
+# XML declaration at the start of raw GPX bytes, after an optional UTF-8 byte order mark
+_XML_DECLARATION_RE = re.compile(rb'(?:\xef\xbb\xbf)?<\?xml[^>]*\?>')
+
+# Byte sequences that could hold a literal <trk> or <time> that is not markup: comments,
+# CDATA sections and, after the XML declaration, processing instructions. None may
+# appear before the last </trk>
+_UNSAFE_DOCUMENT_MARKERS = (b'<!--', b'<![CDATA[', b'<?')
+
+# Byte sequences inside a <trk> that could add a <time> that is not a track point
+# timestamp: extension elements from another namespace
+_UNSAFE_TRACK_MARKERS = (b'xmlns', b':time')
+
+# GPX timestamps that datetime.fromisoformat() rejects on older Pythons, e.g. with more
+# than six fractional digits or an offset without a colon
+_GPX_TIME_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})[T ](\d{1,2}):(\d{1,2}):(\d{1,2})'
+                          r'(?:[.,](\d+))?(?:([+-])(\d{2}):?(\d{2})?)?')
+
+EARTH_RADIUS_M = 6371000.0  # Earth's radius in meters
+
+# Degrees to radians; multiplying by it skips a math.radians() call in pure-Python loops
+_DEG2RAD = math.pi / 180.0
+
+# Largest search radius for which the equirectangular approximation is used
+EQUIRECTANGULAR_MAX_RADIUS_M = 10000.0
+
+# Total size of source files whose parsed form may be kept between the two passes
+PARSED_CACHE_LIMIT_BYTES = 256 * 1024 * 1024
+
+# Files larger than this are always streamed during analysis and parsed again when written
+PARSED_CACHE_MAX_FILE_BYTES = 50 * 1024 * 1024
+
+# Total input size below which files are processed without worker processes when
+# max_workers is not set: starting the pool (and importing NumPy/Numba in every
+# worker) takes longer than a small batch
+PARALLEL_MIN_TOTAL_BYTES = 16 * 1024 * 1024
+
+# Smallest track for which the closest-point search is split across Numba threads
+PARALLEL_KERNEL_MIN_POINTS = 200000
+
+# Threads writing output files when files are shifted sequentially: several writes in
+# flight hide per-file latency on slow or network-mounted output folders
+WRITER_THREADS = 4
+
+# Name of the file caching analysis results between runs, and the folder it is kept in
+# unless GPXAligner is given a cache_dir
+ANALYSIS_CACHE_NAME = '.gpx_align_cache'
+DEFAULT_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or
+                                 os.path.join(os.path.expanduser('~'), '.cache'),
+                                 'gpx_time_aligner')
+
+
+def _closest_point_kernel(lats, lons, lat0, lon0, cos_lat0, dlat_max, dlon_max, max_key,
+                          threshold_key, haversine):
+    """
+    Find the index of the closest point within the radius (compiled with Numba).
+    
+    Points outside the bounding box are rejected before computing a comparison key:
+    the Haversine term a when haversine is set, otherwise the squared angular distance
+    of the equirectangular approximation (see GPXAligner._distance_key()), so no
+    square root is taken per point. The scan stops at the first point whose key is below
+    threshold_key.
+    
+    Returns:
+        Tuple of (index, key); index is -1 if no point is within the radius
+    """
+    best_index = -1
+    best_key = 1e30
+    
+    for i in range(lats.size):
+        dlat = lats[i] - lat0
+        if abs(dlat) > dlat_max:
+            continue
+        dlon = (lons[i] - lon0 + 180.0) % 360.0 - 180.0
+        if abs(dlon) > dlon_max:
+            continue
+        
+        if haversine:
+            s_lat = math.sin(math.radians(dlat) * 0.5)
+            s_lon = math.sin(math.radians(dlon) * 0.5)
+            key = s_lat * s_lat + cos_lat0 * math.cos(math.radians(lats[i])) * s_lon * s_lon
+        else:
+            x = math.radians(dlon) * cos_lat0
+            y = math.radians(dlat)
+            key = x * x + y * y
+        
+        if key <= max_key and key < best_key:
+            best_key = key
+            best_index = i
+            if best_key < threshold_key:
+                break
+    
+    return best_index, best_key
+
+
+if njit is not None:
+    _closest_point_kernel = njit(cache=True, fastmath=True)(_closest_point_kernel)
+
+
+def _closest_point_kernel_parallel(lats, lons, lat0, lon0, cos_lat0, dlat_max, dlon_max,
+                                   max_key, threshold_key, haversine, num_chunks):
+    """
+    Multi-threaded version of _closest_point_kernel() (compiled with Numba).
+    
+    The points are split into num_chunks contiguous chunks scanned in a prange loop,
+    and the per-chunk results are reduced in order so the result is exactly what the
+    sequential kernel returns.
+    """
+    n = lats.size
+    chunk_size = (n + num_chunks - 1) // num_chunks
+    chunk_indices = np.full(num_chunks, -1, dtype=np.int64)
+    chunk_keys = np.full(num_chunks, 1e30)
+    
+    for c in prange(num_chunks):
+        start = c * chunk_size
+        stop = min(start + chunk_size, n)
+        if start < stop:
+            i, key = _closest_point_kernel(
+                lats[start:stop], lons[start:stop], lat0, lon0, cos_lat0,
+                dlat_max, dlon_max, max_key, threshold_key, haversine
+            )
+            if i >= 0:
+                chunk_indices[c] = start + i
+                chunk_keys[c] = key
+    
+    best_index = -1
+    best_key = 1e30
+    for c in range(num_chunks):
+        if chunk_indices[c] < 0:
+            continue
+        if chunk_keys[c] < threshold_key:
+            return chunk_indices[c], chunk_keys[c]
+        if chunk_keys[c] < best_key:
+            best_key = chunk_keys[c]
+            best_index = chunk_indices[c]
+    
+    return best_index, best_key
+
+
+if njit is not None:
+    _closest_point_kernel_parallel = njit(cache=True, fastmath=True, parallel=True)(
+        _closest_point_kernel_parallel
+    )
+
+
+def _parse_gpx_time(text: str) -> datetime:
+    """
+    Parse a GPX <time> string, falling back to _GPX_TIME_RE for formats that
+    datetime.fromisoformat() rejects.
+    
+    Raises:
+        ValueError: If the text is not a GPX timestamp
+    """
+    text = text.strip()
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    
+    match = _GPX_TIME_RE.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Unrecognized GPX timestamp: {text!r}")
+    
+    year, month, day, hour, minute, second, fraction, sign, off_hours, off_minutes = match.groups()
+    tzinfo = None
+    if sign:
+        offset = timedelta(hours=int(off_hours), minutes=int(off_minutes or 0))
+        tzinfo = timezone(-offset if sign == '-' else offset)
+    microsecond = int((fraction or '0')[:6].ljust(6, '0'))
+    
+    return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                    microsecond, tzinfo)
+
+
+def _format_gpx_time(value: datetime) -> str:
+    """
+    Format a datetime as a GPX <time> string, using the 'Z' suffix for UTC.
+    """
+    text = value.isoformat()
+    if text.endswith('+00:00'):
+        text = text[:-6] + 'Z'
+    return text
+
+
+def _close_analysis_cache(analysis_cache) -> None:
+    """
+    Close an analysis cache opened by GPXAligner._open_analysis_cache().
+    
+    Errors are ignored: the cache only saves time and must not fail a run.
+    """
+    try:
+        analysis_cache.close()
+    except Exception:
+        pass
+
+
+def _find_gpx_files(folder: str) -> List[str]:
+    """
+    List the GPX files in a folder, sorted by path.
+    
+    The extension is matched case-insensitively in a single directory scan. As with
+    glob.glob(), hidden files are skipped and a missing or unreadable folder is empty.
+    """
+    try:
+        with os.scandir(folder) as entries:
+            return sorted(entry.path for entry in entries
+                          if entry.name.lower().endswith('.gpx')
+                          and not entry.name.startswith('.') and entry.is_file())
+    except OSError:
+        return []
+
+
+def _parse_gpx_file(filepath: str):
+    """
+    Parse a GPX file with gpxpy.
+    
+    The file is read as bytes and decoded once by gpxpy rather than by a text-mode
+    file object. lxml code paths pass the file name straight to libxml2 instead.
+    """
+    # Imported here so the fast engine never pays for loading gpxpy
+    import gpxpy
+    
+    with open(filepath, 'rb') as gpx_file:
+        return gpxpy.parse(gpx_file.read())
+
+
+def _write_output(output_path: str, data: bytes):
+    """Write serialized GPX data to output_path."""
+    with open(output_path, 'wb') as output_file:
+        output_file.write(data)
+
+
+def _copy_unshifted(filepath: str, output_path: str):
+    """Copy a file whose time offset is zero to output_path unchanged."""
+    try:
+        shutil.copyfile(filepath, output_path)
+    except shutil.SameFileError:
+        # Aligning in place: the file already is its own aligned version
+        pass
+
+
+def _lxml_output_options(document) -> dict:
+    """Keyword arguments that make lxml repeat a document's original XML declaration."""
+    # lxml reports a missing standalone declaration as False, so only repeat a 'yes'
+    docinfo = document.docinfo
+    return dict(xml_declaration=True, encoding=docinfo.encoding or 'UTF-8',
+                standalone=True if docinfo.standalone else None)
+
+
+@dataclass
+class TrackArrays:
+    """
+    Timestamped track points of one GPX file as a struct of arrays.
+    
+    Attributes:
+        lats: Float64 array of latitudes
+        lons: Float64 array of longitudes
+        times: Timestamp of each point, either a datetime or the raw GPX <time>
+            text (see time_at())
+        index: Optional (N, 3) array of (track_index, segment_index, point_index)
+            locating each point in the source document
+    """
+    lats: 'np.ndarray'
+    lons: 'np.ndarray'
+    times: List[Union[datetime, str]]
+    index: Optional['np.ndarray'] = None
+    
+    def __len__(self) -> int:
+        return self.lats.size
+    
+    def time_at(self, i: int) -> datetime:
+        """Timestamp of point i as a datetime, parsing it if it is still text."""
+        value = self.times[i]
+        return _parse_gpx_time(value) if isinstance(value, str) else value
+    
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """(min_lat, max_lat, min_lon, max_lon) of the points; the track must not be empty."""
+        return (float(self.lats.min()), float(self.lats.max()),
+                float(self.lons.min()), float(self.lons.max()))
 
 
 class GPXAligner:
-    def __init__(self, alignment_lat: float, alignment_lon: float, radius_meters: float):
+    def __init__(self, alignment_lat: float, alignment_lon: float, radius_meters: float,
+                 low_memory: bool = False, max_workers: Optional[int] = None,
+                 precision_threshold: float = 0.0, engine: Optional[str] = None,
+                 use_cache: bool = False, cache_dir: Optional[str] = None):
         """
         Initialize the GPX aligner.
         
@@ -37,11 +359,61 @@ class GPXAligner:
             alignment_lat: Latitude of the alignment point
             alignment_lon: Longitude of the alignment point
             radius_meters: Search radius in meters around the alignment point
+            low_memory: Stream files in the analysis pass and re-parse them when writing
+                instead of keeping parsed documents in memory
+            max_workers: Worker processes for per-file work (None = CPU count for batches
+                of at least PARALLEL_MIN_TOTAL_BYTES, 1 = serial)
+            precision_threshold: Accept the first point closer than this many meters
+                without scanning the rest of the track (0 = always find the closest
+                point). The matched point is then "good enough" rather than provably
+                the closest, so on a track passing the alignment point several times
+                an earlier pass can win over a closer later one.
+            engine: 'fast' (lxml and NumPy) or 'gpxpy'; None picks 'fast' when both
+                lxml and NumPy are installed
+            use_cache: Remember analysis results in ANALYSIS_CACHE_NAME and reuse them
+                for unchanged files on later runs
+            cache_dir: Folder for ANALYSIS_CACHE_NAME (None = DEFAULT_CACHE_DIR); only
+                used with use_cache
+        
+        Raises:
+            ValueError: If the engine is unknown or its dependencies are missing
         """
         self.alignment_lat = alignment_lat
         self.alignment_lon = alignment_lon
         self.radius_meters = radius_meters
+        self.low_memory = low_memory
+        self.max_workers = max_workers
+        self.precision_threshold = precision_threshold
+        
+        if engine is None:
+            engine = 'fast' if etree is not None and np is not None else 'gpxpy'
+        if engine == 'fast':
+            if etree is None or np is None:
+                raise ValueError("The fast engine requires lxml and NumPy "
+                                 "(pip install lxml numpy)")
+        elif engine == 'gpxpy':
+            if importlib.util.find_spec('gpxpy') is None:
+                raise ValueError("gpxpy library is required. Install it with: pip install gpxpy")
+        else:
+            raise ValueError(f"Unknown engine: {engine}")
+        self.engine = engine
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
         self.reference_time = None
+        
+        # Alignment point constants reused by every distance calculation
+        self._lat0_rad = math.radians(alignment_lat)
+        self._lon0_rad = math.radians(alignment_lon)
+        self._cos_lat0 = math.cos(self._lat0_rad)
+        
+        # Bounding box (in degrees) containing every point within the search radius
+        angular_radius = radius_meters / EARTH_RADIUS_M
+        self._dlat_max = math.degrees(angular_radius)
+        if angular_radius < math.pi / 2 and math.sin(angular_radius) < self._cos_lat0:
+            self._dlon_max = math.degrees(math.asin(math.sin(angular_radius) / self._cos_lat0))
+        else:
+            # The search circle reaches a pole, so every longitude qualifies
+            self._dlon_max = 180.0
     
     def haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """
@@ -52,17 +424,98 @@ class GPXAligner:
         """
         R = 6371000  # Earth's radius in meters
         
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
+        lat1_rad = lat1 * _DEG2RAD
+        lat2_rad = lat2 * _DEG2RAD
+        delta_lat = (lat2 - lat1) * _DEG2RAD
+        delta_lon = (lon2 - lon1) * _DEG2RAD
         
-        a = (math.sin(delta_lat / 2) ** 2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        s_lat = math.sin(delta_lat * 0.5)
+        s_lon = math.sin(delta_lon * 0.5)
+        a = s_lat * s_lat + math.cos(lat1_rad) * math.cos(lat2_rad) * s_lon * s_lon
+        c = 2 * math.asin(math.sqrt(min(a, 1.0)))
         
         return R * c
     
+    def haversine_from_alignment(self, lat: float, lon: float) -> float:
+        """
+        Calculate the great circle distance from the alignment point to another point.
+        
+        Uses the alignment point constants precomputed in __init__.
+        
+        Returns:
+            Distance in meters
+        """
+        lat_rad = lat * _DEG2RAD
+        delta_lat = lat_rad - self._lat0_rad
+        delta_lon = lon * _DEG2RAD - self._lon0_rad
+        
+        s_lat = math.sin(delta_lat * 0.5)
+        s_lon = math.sin(delta_lon * 0.5)
+        a = s_lat * s_lat + self._cos_lat0 * math.cos(lat_rad) * s_lon * s_lon
+        c = 2 * math.asin(math.sqrt(min(a, 1.0)))
+        
+        return EARTH_RADIUS_M * c
+    
+    def _equirectangular_key_vector(self, lats, lons):
+        """Squared angular distances in the equirectangular projection, see _distance_key()."""
+        x = np.radians((lons - self.alignment_lon + 180.0) % 360.0 - 180.0) * self._cos_lat0
+        y = np.radians(lats - self.alignment_lat)
+        
+        return x * x + y * y
+    
+    def _haversine_key_vector(self, lats, lons):
+        """The Haversine term 'a' for many points at once, see _distance_key()."""
+        lats_rad = np.radians(lats)
+        delta_lat = lats_rad - self._lat0_rad
+        delta_lon = np.radians(lons) - self._lon0_rad
+        
+        s_lat = np.sin(delta_lat * 0.5)
+        s_lon = np.sin(delta_lon * 0.5)
+        return s_lat * s_lat + self._cos_lat0 * np.cos(lats_rad) * s_lon * s_lon
+    
+    def _distance_key(self, meters: float) -> float:
+        """
+        Convert a distance in meters to the key the closest-point search compares.
+        
+        The key is the squared angular distance in equirectangular mode and the
+        Haversine term a = sin^2(d / 2R) otherwise. Both grow monotonically with
+        distance, so points are ranked without taking a square root per point.
+        """
+        if self.radius_meters <= EQUIRECTANGULAR_MAX_RADIUS_M:
+            return (meters / EARTH_RADIUS_M) ** 2
+        
+        return math.sin(min(meters / (2 * EARTH_RADIUS_M), math.pi / 2)) ** 2
+    
+    def _to_soa(self, gpx_data) -> TrackArrays:
+        """
+        Convert the timestamped track points of a gpxpy document to a TrackArrays.
+        """
+        lats = []
+        lons = []
+        times = []
+        index = []
+        
+        for track_idx, track in enumerate(gpx_data.tracks):
+            for segment_idx, segment in enumerate(track.segments):
+                points = segment.points
+                count = len(points)
+                has_time = np.fromiter((p.time is not None for p in points), dtype=bool, count=count)
+                
+                lats.append(np.fromiter((p.latitude for p in points), dtype=np.float64, count=count)[has_time])
+                lons.append(np.fromiter((p.longitude for p in points), dtype=np.float64, count=count)[has_time])
+                times.extend(p.time for p in points if p.time is not None)
+                
+                segment_index = np.empty((int(has_time.sum()), 3), dtype=np.intp)
+                segment_index[:, 0] = track_idx
+                segment_index[:, 1] = segment_idx
+                segment_index[:, 2] = np.flatnonzero(has_time)
+                index.append(segment_index)
+        
+        if not index:
+            return TrackArrays(np.empty(0), np.empty(0), [], np.empty((0, 3), dtype=np.intp))
+        
+        return TrackArrays(np.concatenate(lats), np.concatenate(lons), times, np.concatenate(index))
+    
     def find_closest_point_in_radius(self, gpx_data) -> Optional[Tuple[int, int, datetime, float]]:
         """
         Find the closest point to the alignment point within the specified radius.
@@ -70,25 +523,125 @@ class GPXAligner:
         Returns:
             Tuple of (track_index, point_index, timestamp, distance) or None if no point found
         """
-        closest_distance = float('inf')
+        if np is None:
+            return self._find_closest_point_scalar(gpx_data)
+        
+        track = self._to_soa(gpx_data)
+        if len(track) == 0:
+            return None
+        
+        best, distance = self._closest_index(track.lats, track.lons)
+        if best < 0:
+            return None
+        
+        track_idx, segment_idx, point_idx = (int(i) for i in track.index[best])
+        return (track_idx, segment_idx, point_idx, track.time_at(best), distance)
+    
+    def _closest_index(self, lats, lons) -> Tuple[int, float]:
+        """
+        Locate the closest point within the search radius in coordinate arrays.
+        
+        Returns:
+            Tuple of (array_index, distance); array_index is -1 if none is in radius
+        """
+        use_equirectangular = self.radius_meters <= EQUIRECTANGULAR_MAX_RADIUS_M
+        max_key = self._distance_key(self.radius_meters)
+        threshold_key = self._distance_key(self.precision_threshold)
+        
+        if njit is not None:
+            args = (lats, lons, self.alignment_lat, self.alignment_lon, self._cos_lat0,
+                    self._dlat_max, self._dlon_max, max_key, threshold_key,
+                    not use_equirectangular)
+            num_threads = get_num_threads()
+            if lats.size >= PARALLEL_KERNEL_MIN_POINTS and num_threads > 1:
+                best, _ = _closest_point_kernel_parallel(*args, num_threads)
+            else:
+                best, _ = _closest_point_kernel(*args)
+            best = int(best)
+        else:
+            # Only points inside the bounding box need a distance calculation. The
+            # latitude test is cheap and rejects most points, so the longitude wrap-around
+            # is only computed for its survivors
+            candidates = np.flatnonzero(np.abs(lats - self.alignment_lat) <= self._dlat_max)
+            dlons = (lons[candidates] - self.alignment_lon + 180.0) % 360.0 - 180.0
+            candidates = candidates[np.abs(dlons) <= self._dlon_max]
+            if candidates.size == 0:
+                return -1, float('inf')
+            
+            if use_equirectangular:
+                keys = self._equirectangular_key_vector(lats[candidates], lons[candidates])
+            else:
+                keys = self._haversine_key_vector(lats[candidates], lons[candidates])
+            keys = np.where(keys <= max_key, keys, np.inf)
+            
+            # The first point under the precision threshold is what a sequential scan
+            # would stop at; otherwise fall back to the closest point overall
+            close_enough = np.flatnonzero(keys < threshold_key)
+            best = int(close_enough[0]) if close_enough.size else int(np.argmin(keys))
+            best = int(candidates[best]) if np.isfinite(keys[best]) else -1
+        
+        if best < 0:
+            return -1, float('inf')
+        
+        # Report the exact great-circle distance for the winning point only
+        distance = self.haversine_from_alignment(float(lats[best]), float(lons[best]))
+        return best, distance
+    
+    def _find_closest_point_scalar(self, gpx_data) -> Optional[Tuple[int, int, datetime, float]]:
+        """
+        Pure-Python fallback for find_closest_point_in_radius when NumPy is not installed.
+        """
+        # Bind everything used per point to locals: in CPython, global and attribute
+        # lookups are a large share of this loop's cost
+        sin, cos, deg2rad = math.sin, math.cos, _DEG2RAD
+        alat, alon, radius = self.alignment_lat, self.alignment_lon, self.radius_meters
+        cos_lat0, dlat_max, dlon_max = self._cos_lat0, self._dlat_max, self._dlon_max
+        max_key = self._distance_key(radius)
+        threshold_key = self._distance_key(self.precision_threshold)
+        use_equirectangular = radius <= EQUIRECTANGULAR_MAX_RADIUS_M
+        
+        closest_key = float('inf')
         closest_info = None
         
         for track_idx, track in enumerate(gpx_data.tracks):
             for segment_idx, segment in enumerate(track.segments):
                 for point_idx, point in enumerate(segment.points):
-                    if point.time is None:
+                    t, la, lo = point.time, point.latitude, point.longitude
+                    if t is None:
                         continue
                     
-                    distance = self.haversine_distance(
-                        self.alignment_lat, self.alignment_lon,
-                        point.latitude, point.longitude
-                    )
+                    # Cheap bounding-box rejection before any distance calculation
+                    dlat = la - alat
+                    if abs(dlat) > dlat_max:
+                        continue
+                    dlon = (lo - alon + 180.0) % 360.0 - 180.0
+                    if abs(dlon) > dlon_max:
+                        continue
                     
-                    if distance <= self.radius_meters and distance < closest_distance:
-                        closest_distance = distance
-                        closest_info = (track_idx, segment_idx, point_idx, point.time, distance)
+                    # Inlined comparison keys, see _distance_key()
+                    if use_equirectangular:
+                        x = dlon * deg2rad * cos_lat0
+                        y = dlat * deg2rad
+                        key = x * x + y * y
+                    else:
+                        s_lat = sin(dlat * deg2rad * 0.5)
+                        s_lon = sin(dlon * deg2rad * 0.5)
+                        key = s_lat * s_lat + cos_lat0 * cos(la * deg2rad) * s_lon * s_lon
+                    
+                    if key <= max_key and key < closest_key:
+                        closest_key = key
+                        closest_info = (track_idx, segment_idx, point_idx, t, la, lo)
+                        if key < threshold_key:
+                            # Good enough: skip the rest of the traversal
+                            return (track_idx, segment_idx, point_idx, t,
+                                    self.haversine_from_alignment(la, lo))
+        
+        if closest_info is None:
+            return None
         
-        return closest_info
+        # Report the exact great-circle distance for the winning point only
+        track_idx, segment_idx, point_idx, t, la, lo = closest_info
+        return (track_idx, segment_idx, point_idx, t, self.haversine_from_alignment(la, lo))
     
     def adjust_gpx_timing(self, gpx_data, time_offset: timedelta):
         """
@@ -100,6 +653,88 @@ class GPXAligner:
                     if point.time is not None:
                         point.time += time_offset
     
+    def _read_points(self, filepath: str) -> TrackArrays:
+        """
+        Read the track points of a GPX file into coordinate arrays using lxml.
+        
+        The file is streamed with iterparse and each point is freed once read.
+        
+        Returns:
+            TrackArrays of every track point with a timestamp, with times kept as raw text
+        """
+        lats = []
+        lons = []
+        times = []
+        
+        for point, time_text in self._stream_timed_points(filepath):
+            if time_text and time_text.strip():
+                lats.append(float(point.get('lat')))
+                lons.append(float(point.get('lon')))
+                # Parsed on demand: only the matched point's time is ever needed
+                times.append(time_text)
+        
+        return TrackArrays(np.array(lats, dtype=np.float64), np.array(lons, dtype=np.float64), times)
+    
+    def _stream_timed_points(self, filepath: str):
+        """
+        Stream (trkpt_element, time_text) pairs for every track point with a <time>.
+        
+        Reacting to <time> end events avoids a findtext() lookup per point. Each <trkpt>
+        is freed at its own end event, after its <time> has been reported.
+        """
+        last_point = None
+        for _, elem in etree.iterparse(filepath, events=('end',), tag=('{*}trkpt', '{*}time'),
+                                       resolve_entities=False, no_network=True):
+            if elem.tag.endswith('time'):
+                # Only the first <time> directly inside a <trkpt> counts
+                point = elem.getparent()
+                if point is not last_point and point.tag.rpartition('}')[2] == 'trkpt':
+                    last_point = point
+                    yield point, elem.text
+            else:
+                # Free the processed point and any siblings already handled
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+    
+    def adjust_time_elements(self, time_elements, time_offset: timedelta):
+        """Shift the text of lxml <time> elements by the given offset."""
+        texts = [elem.text.strip() for elem in time_elements]
+        for elem, text in zip(time_elements, self._shift_time_texts(texts, time_offset)):
+            elem.text = text
+    
+    def _shift_time_texts(self, texts: List[str], time_offset: timedelta) -> List[str]:
+        """
+        Shift GPX timestamp strings by the given offset.
+        
+        UTC timestamps ('Z' suffix) are shifted as a single NumPy datetime64 array;
+        any other form is shifted one at a time, keeping its time zone notation.
+        """
+        shifted_texts = None
+        if all(text.endswith('Z') for text in texts):
+            try:
+                times = np.array([text[:-1] for text in texts], dtype='datetime64[ns]')
+            except ValueError:
+                times = None
+            
+            if times is not None:
+                shifted = times + np.timedelta64(time_offset // timedelta(microseconds=1), 'us')
+                
+                # Keep the output as short as the precision of the values allows
+                shifted_ns = shifted.view(np.int64)
+                if not (shifted_ns % 1000000000).any():
+                    unit = 's'
+                elif not (shifted_ns % 1000000).any():
+                    unit = 'ms'
+                else:
+                    unit = 'us'
+                shifted_texts = [text + 'Z' for text in np.datetime_as_string(shifted, unit=unit)]
+        
+        if shifted_texts is None:
+            shifted_texts = [_format_gpx_time(_parse_gpx_time(text) + time_offset) for text in texts]
+        
+        return shifted_texts
+    
     def process_single_file(self, filepath: str) -> Tuple[bool, str, Optional[datetime]]:
         """
         Process a single GPX file and find its alignment point.
@@ -107,21 +742,302 @@ class GPXAligner:
         Returns:
             Tuple of (success, message, alignment_time)
         """
+        success, message, alignment_time, _, _ = self._analyze_file(filepath)
+        return success, message, alignment_time
+    
+    def _analyze_file(self, filepath: str, keep_document: bool = False):
+        """
+        Analyze a GPX file, optionally keeping its gpxpy object for the write pass.
+        
+        keep_document only applies to the gpxpy engine: the fast engine's write pass
+        edits the raw file instead.
+        
+        Returns:
+            Tuple of (success, message, alignment_time, document, bounds) where document
+            is the gpxpy object or None, and bounds is the file's TrackArrays.bounds()
+            (fast engine only, else None)
+        """
+        document = None
+        bounds = None
+        
         try:
-            with open(filepath, 'r', encoding='utf-8') as gpx_file:
-                gpx_data = gpxpy.parse(gpx_file)
-            
-            closest_info = self.find_closest_point_in_radius(gpx_data)
+            if self.engine == 'fast':
+                # Fast path: read only the track points, no gpxpy object graph
+                track = self._read_points(filepath)
+                best, distance = self._closest_index(track.lats, track.lons) if len(track) else (-1, 0.0)
+                closest_info = None if best < 0 else (None, None, None, track.time_at(best), distance)
+                if len(track):
+                    bounds = track.bounds()
+            else:
+                gpx_data = _parse_gpx_file(filepath)
+                
+                closest_info = self.find_closest_point_in_radius(gpx_data)
+                if keep_document:
+                    document = gpx_data
             
             if closest_info is None:
-                return False, f"No points found within {self.radius_meters}m of alignment point", None
+                return False, f"No points found within {self.radius_meters}m of alignment point", None, None, bounds
             
             track_idx, segment_idx, point_idx, alignment_time, distance = closest_info
             
-            return True, f"Found alignment point at distance {distance:.1f}m", alignment_time
+            return True, f"Found alignment point at distance {distance:.1f}m", alignment_time, document, bounds
             
         except Exception as e:
-            return False, f"Error processing file: {str(e)}", None
+            return False, f"Error processing file: {str(e)}", None, None, None
+    
+    def _write_aligned_file(self, filepath: str, output_path: str, time_offset: timedelta,
+                            document=None):
+        """
+        Shift the timestamps of one GPX file and save the result.
+        
+        Args:
+            filepath: Source GPX file
+            output_path: Aligned file to write
+            time_offset: Offset added to every timestamp
+            document: gpxpy object from _analyze_file, or None to splice the new
+                timestamps into the file's bytes (fast engine) or parse it here
+        """
+        if not time_offset:
+            _copy_unshifted(filepath, output_path)
+            return
+        
+        if self.engine == 'fast' and document is None:
+            data = self._splice_aligned_file(filepath, time_offset)
+            if data is not None:
+                _write_output(output_path, data)
+                return
+        
+        document = self._shift_document(filepath, time_offset, document)
+        if self.engine == 'gpxpy':
+            _write_output(output_path, document.to_xml().encode('utf-8'))
+        else:
+            # Let libxml2 serialize straight into the file instead of building bytes first
+            document.write(output_path, **_lxml_output_options(document))
+    
+    def _queue_write(self, writer: ThreadPoolExecutor, filepath: str, output_path: str,
+                     time_offset: timedelta, document=None) -> Future:
+        """
+        Shift one GPX file on the calling thread and hand its output to a writer thread.
+        
+        Returns:
+            Future completed once the file is written, carrying any error
+        """
+        if not time_offset:
+            return writer.submit(_copy_unshifted, filepath, output_path)
+        
+        try:
+            data = self._render_aligned_file(filepath, time_offset, document)
+        except Exception as e:
+            future = Future()
+            future.set_exception(e)
+            return future
+        
+        return writer.submit(_write_output, output_path, data)
+    
+    def _render_aligned_file(self, filepath: str, time_offset: timedelta, document=None) -> bytes:
+        """
+        Shift the timestamps of one GPX file and return the serialized result.
+        """
+        if self.engine == 'fast' and document is None:
+            data = self._splice_aligned_file(filepath, time_offset)
+            if data is not None:
+                return data
+        
+        document = self._shift_document(filepath, time_offset, document)
+        if self.engine == 'gpxpy':
+            return document.to_xml().encode('utf-8')
+        
+        return etree.tostring(document, **_lxml_output_options(document))
+    
+    def _splice_aligned_file(self, filepath: str, time_offset: timedelta) -> Optional[bytes]:
+        """
+        Shift the track point timestamps of a GPX file by editing its raw bytes.
+        
+        Only the timestamp texts change; every other byte is copied verbatim, and no
+        XML tree is built.
+        
+        Returns:
+            The aligned file contents, or None if the timestamps cannot be located
+            reliably (namespace prefixes in a track, comments, CDATA or processing
+            instructions before the last track ends, or a text encoding that is not
+            ASCII-compatible), in which case the file is parsed
+        """
+        with open(filepath, 'rb') as gpx_file:
+            data = gpx_file.read()
+        
+        # Every track must open with a plain <trk> for the scan below to see it
+        track_count = data.count(b'<trk>')
+        if (track_count == 0 or data.find(b':trk') != -1 or
+                data.count(b'<trk') - data.count(b'<trkpt') - data.count(b'<trkseg') != track_count):
+            return None
+        
+        # A <trk> inside a comment, CDATA section or processing instruction would open a
+        # track region early and pull waypoint or route times into it
+        declaration = _XML_DECLARATION_RE.match(data)
+        body_start = declaration.end() if declaration else 0
+        last_track_end = data.rfind(b'</trk>')
+        if any(data.find(marker, body_start, last_track_end) != -1
+               for marker in _UNSAFE_DOCUMENT_MARKERS):
+            return None
+        
+        # Outside <extensions> GPX only allows <time> in track points, and extension
+        # elements belong to another namespace, so any <time> left in a track is a track
+        # point timestamp. Each track is split at its <time> elements; the bytes around
+        # the tracks are copied as they are
+        parts = [b'']
+        position = 0
+        start = data.find(b'<trk>')
+        while start != -1:
+            end = data.find(b'</trk>', start)
+            if end == -1 or any(data.find(marker, start, end) != -1
+                                for marker in _UNSAFE_TRACK_MARKERS):
+                return None
+            
+            track_parts = _TIME_ELEMENT_RE.split(data[start:end])
+            if len(track_parts) // 4 != data.count(b'<time', start, end):
+                return None
+            
+            parts[-1] += data[position:start] + track_parts[0]
+            parts.extend(track_parts[1:])
+            position = end
+            start = data.find(b'<trk>', end)
+        parts[-1] += data[position:]
+        
+        try:
+            texts = [text.strip().decode('ascii') for text in parts[2::4]]
+        except UnicodeDecodeError:
+            return None
+        
+        # Blank timestamps are left as they are, like adjust_time_elements() does
+        timed = [i for i, text in enumerate(texts) if text]
+        shifted = self._shift_time_texts([texts[i] for i in timed], time_offset)
+        for i, text in zip(timed, shifted):
+            parts[2 + 4 * i] = text.encode('ascii')
+        
+        return b''.join(parts)
+    
+    def _shift_document(self, filepath: str, time_offset: timedelta, document=None):
+        """
+        Shift the timestamps of one parsed GPX file, parsing it first if needed.
+        
+        Returns:
+            The shifted lxml tree or gpxpy object
+        """
+        if self.engine == 'gpxpy':
+            if document is None:
+                document = _parse_gpx_file(filepath)
+            self.adjust_gpx_timing(document, time_offset)
+            return document
+        
+        # lxml tree: patch the non-blank track point <time> elements in place
+        tree = etree.parse(filepath, _XML_PARSER)
+        time_elements = [elem for elem in tree.iterfind('.//{*}trkpt/{*}time')
+                         if elem.text and elem.text.strip()]
+        self.adjust_time_elements(time_elements, time_offset)
+        return tree
+    
+    def _open_analysis_cache(self):
+        """
+        Open the persistent cache of analysis results in cache_dir or DEFAULT_CACHE_DIR.
+        
+        Returns:
+            The open shelve, or None if caching is disabled or the cache cannot be opened
+        """
+        if not self.use_cache:
+            return None
+        
+        cache_dir = self.cache_dir or DEFAULT_CACHE_DIR
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            return shelve.open(os.path.join(cache_dir, ANALYSIS_CACHE_NAME))
+        except Exception:
+            # The cache only saves time, so run without it rather than fail
+            return None
+    
+    def _analysis_cache_key(self, filepath: str, bounds: bool = False) -> Optional[str]:
+        """
+        Key of a file's analysis result, or None if the file cannot be stat'ed.
+        
+        The key covers the file's modification time and size and every setting that
+        affects which point is matched, so a changed file or setting is a cache miss.
+        With bounds=True it is the key of the file's point bounds instead, which do not
+        depend on the settings.
+        """
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        
+        key = (os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+        if bounds:
+            key += ('bounds',)
+        else:
+            key += (self.alignment_lat, self.alignment_lon, self.radius_meters,
+                    self.precision_threshold, self.engine)
+        return hashlib.blake2b(repr(key).encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _bounds_in_search_area(self, bounds: Tuple[float, float, float, float]) -> bool:
+        """
+        Whether a point within bounds (see TrackArrays.bounds()) can pass the bounding-box
+        test of the closest-point search. If not, the file has no point in the radius.
+        """
+        min_lat, max_lat, min_lon, max_lon = bounds
+        if (min_lat - self.alignment_lat > self._dlat_max or
+                self.alignment_lat - max_lat > self._dlat_max):
+            return False
+        if self._dlon_max >= 180.0:
+            return True
+        
+        # Compare with the search interval and its copies a full turn away, which covers
+        # search areas crossing the antimeridian
+        west = self.alignment_lon - self._dlon_max
+        east = self.alignment_lon + self._dlon_max
+        return any(min_lon <= east + shift and max_lon >= west + shift
+                   for shift in (-360.0, 0.0, 360.0))
+    
+    def _fits_parsed_cache(self, filepath: str, cached_bytes: int) -> bool:
+        """
+        Whether the parsed form of filepath should be kept for the write pass, given the
+        total size of the files already kept.
+        
+        Never with the fast engine: its write pass edits the raw file instead.
+        """
+        if self.low_memory or self.engine == 'fast':
+            return False
+        
+        file_size = os.path.getsize(filepath)
+        return (file_size <= PARSED_CACHE_MAX_FILE_BYTES and
+                cached_bytes + file_size <= PARSED_CACHE_LIMIT_BYTES)
+    
+    def _worker_count(self, num_files: int) -> int:
+        """
+        Number of worker processes for a batch of files (max_workers or CPU count, capped).
+        """
+        return min(self.max_workers or os.cpu_count() or 1, num_files)
+    
+    def _create_executor(self, gpx_files: List[str]) -> Optional[Executor]:
+        """
+        Create the process pool used for per-file work, or None to run serially.
+
+        Falls back to a thread pool when this platform cannot start worker processes.
+        """
+        workers = self._worker_count(len(gpx_files))
+        if workers <= 1:
+            return None
+        
+        if self.max_workers is None:
+            total_bytes = sum(os.path.getsize(filepath) for filepath in gpx_files)
+            if total_bytes < PARALLEL_MIN_TOTAL_BYTES:
+                return None
+        
+        try:
+            return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                       initargs=(self,))
+        except (ImportError, NotImplementedError, OSError):
+            # No working multiprocessing (e.g. no sem_open in some sandboxes); threads still
+            # overlap file I/O and lxml parsing, which releases the GIL
+            return ThreadPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                      initargs=(self,))
     
     def align_files(self, input_folder: str, output_folder: str = None) -> dict:
         """
@@ -141,14 +1057,7 @@ class GPXAligner:
         os.makedirs(output_folder, exist_ok=True)
         
         # Find all GPX files
-        gpx_patterns = [
-            os.path.join(input_folder, '*.gpx'),
-            os.path.join(input_folder, '*.GPX')
-        ]
-        
-        gpx_files = []
-        for pattern in gpx_patterns:
-            gpx_files.extend(glob.glob(pattern))
+        gpx_files = _find_gpx_files(input_folder)
         
         if not gpx_files:
             return {'error': 'No GPX files found in the specified folder'}
@@ -157,30 +1066,100 @@ class GPXAligner:
         
         # First pass: find alignment times for all files
         file_info = {}
-        alignment_times = []
+        reference_time = None
+        cached_bytes = 0
         
-        for filepath in gpx_files:
-            filename = os.path.basename(filepath)
-            print(f"Analyzing {filename}...")
-            
-            success, message, alignment_time = self.process_single_file(filepath)
-            file_info[filepath] = {
-                'success': success,
-                'message': message,
-                'alignment_time': alignment_time,
-                'filename': filename
-            }
+        # Files unchanged since an earlier run with the same settings are not analyzed
+        # again, nor are unchanged files whose points all lie outside the search area
+        analysis_cache = self._open_analysis_cache()
+        executor = None
+        try:
+            cache_keys = {}
+            bounds_keys = {}
+            cached_results = {}
+            if analysis_cache is not None:
+                for filepath in gpx_files:
+                    cache_keys[filepath] = key = self._analysis_cache_key(filepath)
+                    entry = analysis_cache.get(key) if key is not None else None
+                    if entry is not None:
+                        message, alignment_time = entry
+                        cached_results[filepath] = (True, f"{message} (cached)", alignment_time,
+                                                    None, None)
+                        continue
+                    
+                    bounds_keys[filepath] = key = self._analysis_cache_key(filepath, bounds=True)
+                    bounds = analysis_cache.get(key) if key is not None else None
+                    if bounds is not None and not self._bounds_in_search_area(bounds):
+                        message = (f"No points found within {self.radius_meters}m of "
+                                   "alignment point (cached)")
+                        cached_results[filepath] = (False, message, None, None, None)
             
-            if success and alignment_time:
-                alignment_times.append(alignment_time)
+            executor = self._create_executor(gpx_files)
+            if executor is None:
+                # Whether a file is kept is decided before parsing it, so files that will not
+                # fit in the cache are streamed instead of being fully parsed and dropped
+                analyses = ((filepath, cached_results.get(filepath) or self._analyze_file(
+                                filepath, keep_document=self._fits_parsed_cache(filepath, cached_bytes)))
+                            for filepath in gpx_files)
+            else:
+                # Two tasks per worker keep the pool busy without queueing the whole folder
+                window = 2 * self._worker_count(len(gpx_files))
+                futures = _submit_bounded(partial(executor.submit, _analyze_in_worker),
+                                          ((filepath,) for filepath in gpx_files
+                                           if filepath not in cached_results), window)
+                analyses = ((filepath, cached_results[filepath] if filepath in cached_results
+                             else _analysis_result(next(futures)))
+                            for filepath in gpx_files)
             
-            print(f"  {message}")
+            for filepath, (success, message, alignment_time, document, bounds) in analyses:
+                filename = os.path.basename(filepath)
+                print(f"Analyzing {filename}...")
+                
+                # The parsed file is kept for the write pass
+                if document is not None:
+                    cached_bytes += os.path.getsize(filepath)
+                
+                file_info[filepath] = {
+                    'success': success,
+                    'message': message,
+                    'alignment_time': alignment_time,
+                    'filename': filename,
+                    'document': document
+                }
+                
+                if analysis_cache is not None and filepath not in cached_results:
+                    try:
+                        if success and cache_keys.get(filepath):
+                            analysis_cache[cache_keys[filepath]] = (message, alignment_time)
+                        if bounds is not None and bounds_keys.get(filepath):
+                            analysis_cache[bounds_keys[filepath]] = bounds
+                    except Exception:
+                        # A cache that cannot be written is dropped for the rest of the run
+                        _close_analysis_cache(analysis_cache)
+                        analysis_cache = None
+                
+                # Track the earliest alignment time as results arrive
+                if success and alignment_time:
+                    if reference_time is None or alignment_time < reference_time:
+                        reference_time = alignment_time
+                
+                print(f"  {message}")
+        except BaseException:
+            # The write pass will not run, so the workers are not needed any more
+            if executor is not None:
+                executor.shutdown()
+            raise
+        finally:
+            if analysis_cache is not None:
+                _close_analysis_cache(analysis_cache)
         
-        if not alignment_times:
+        if reference_time is None:
+            if executor is not None:
+                executor.shutdown()
             return {'error': 'No files had points within the specified radius of the alignment point'}
         
         # Use the earliest alignment time as reference
-        self.reference_time = min(alignment_times)
+        self.reference_time = reference_time
         print(f"\nUsing reference time: {self.reference_time}")
         
         # Second pass: align and save files
@@ -192,6 +1171,31 @@ class GPXAligner:
             'files': {}
         }
         
+        # Writes run ahead of the loop below, which consumes them in order: in the worker
+        # processes, or else on writer threads so the next file is shifted while earlier
+        # ones are written to disk
+        writer = None
+        if executor is not None:
+            submit = partial(executor.submit, _write_in_worker)
+        else:
+            writer = ThreadPoolExecutor(max_workers=WRITER_THREADS)
+            submit = partial(self._queue_write, writer)
+            # One more than the writers, so each can be busy while the next file is shifted
+            window = WRITER_THREADS + 1
+        
+        # Offsets are computed up front so that building the write arguments cannot fail
+        for info in file_info.values():
+            if info['success']:
+                info['time_offset'] = self.reference_time - info['alignment_time']
+        
+        write_futures = _submit_bounded(
+            submit,
+            ((filepath, os.path.join(output_folder, file_info[filepath]['filename']),
+              file_info[filepath]['time_offset'], file_info[filepath].pop('document', None))
+             for filepath in gpx_files if file_info[filepath]['success']),
+            window
+        )
+        
         for filepath in gpx_files:
             info = file_info[filepath]
             filename = info['filename']
@@ -207,20 +1211,10 @@ class GPXAligner:
                 continue
             
             try:
-                # Load and process the file
-                with open(filepath, 'r', encoding='utf-8') as gpx_file:
-                    gpx_data = gpxpy.parse(gpx_file)
-                
-                # Calculate time offset needed
-                time_offset = self.reference_time - info['alignment_time']
-                
-                # Adjust timing
-                self.adjust_gpx_timing(gpx_data, time_offset)
-                
-                # Save aligned file
+                time_offset = info['time_offset']
                 output_path = os.path.join(output_folder, filename)
-                with open(output_path, 'w', encoding='utf-8') as output_file:
-                    output_file.write(gpx_data.to_xml())
+                
+                next(write_futures).result()
                 
                 results['successful'] += 1
                 results['files'][filename] = {
@@ -240,11 +1234,91 @@ class GPXAligner:
                 }
                 print(f"Failed to align {filename}: {str(e)}")
         
+        if executor is not None:
+            executor.shutdown()
+        if writer is not None:
+            writer.shutdown()
+        
         return results
 
 
+# Aligner used inside process pool workers, set once per worker by _init_worker()
+_worker_aligner = None
+
+
+def _init_worker(aligner: GPXAligner):
+    """Pool initializer storing the aligner configuration in the worker."""
+    global _worker_aligner
+    _worker_aligner = aligner
+    
+    if njit is not None:
+        # Files are already spread over processes; one Numba thread each avoids oversubscription
+        set_num_threads(1)
+
+
+def _analyze_in_worker(filepath: str):
+    """Analyze a file in a worker process; the parsed document is not sent back."""
+    return _worker_aligner._analyze_file(filepath)
+
+
+def _analysis_result(future: Future):
+    """Result of an _analyze_in_worker() future, with any error reported as a failed analysis."""
+    try:
+        return future.result()
+    except Exception as e:
+        return False, f"Error processing file: {str(e)}", None, None, None
+
+
+def _write_in_worker(filepath: str, output_path: str, time_offset: timedelta, document=None):
+    """Write an aligned file in a worker process."""
+    _worker_aligner._write_aligned_file(filepath, output_path, time_offset, document)
+
+
+def _submit_bounded(submit, arg_tuples, window: int):
+    """
+    Call submit(*args), which returns a future (e.g. partial(executor.submit, fn)), for
+    each tuple in arg_tuples, with at most window futures not yet taken by the caller.
+    Yields the futures in submission order; an exception raised by submit is set on
+    that call's future.
+    """
+    pending = deque()
+    for args in arg_tuples:
+        if len(pending) >= window:
+            yield pending.popleft()
+        try:
+            future = submit(*args)
+        except Exception as e:
+            # Fail this call only (e.g. a broken pool), not the calls after it
+            future = Future()
+            future.set_exception(e)
+        pending.append(future)
+    
+    while pending:
+        yield pending.popleft()
+
+
 def main():
     """Main function with user interface."""
+    parser = argparse.ArgumentParser(description="GPX File Time Alignment Tool")
+    parser.add_argument('--low-memory', action='store_true',
+                        help="re-read each file when writing instead of keeping parsed files in memory")
+    parser.add_argument('--workers', type=int, default=None,
+                        help="number of worker processes (default: one per CPU for batches of 16 MB or more, "
+                             "1 disables multiprocessing)")
+    parser.add_argument('--precision-threshold', type=float, default=0.0,
+                        help="accept the first point closer than this many meters instead of the "
+                             "closest one; faster, but the matched point can differ (default: 0, "
+                             "always find the closest point)")
+    parser.add_argument('--engine', choices=('fast', 'gpxpy'), default=None,
+                        help="read and write files with lxml and NumPy (fast) or with gpxpy "
+                             "(default: fast when lxml and NumPy are installed)")
+    parser.add_argument('--cache', action='store_true',
+                        help="reuse analysis results of earlier runs for unchanged files")
+    parser.add_argument('--cache-dir', default=None,
+                        help="folder for the analysis cache; implies --cache "
+                             "(default: %s)" % DEFAULT_CACHE_DIR.replace('%', '%%'))
+    args = parser.parse_args()
+    
     print("GPX File Time Alignment Tool")
     print("=" * 40)
     
@@ -269,7 +1343,15 @@ def main():
         output_folder = None
     
     # Create aligner and process files
-    aligner = GPXAligner(lat, lon, radius)
+    try:
+        aligner = GPXAligner(lat, lon, radius, low_memory=args.low_memory,
+                             max_workers=args.workers,
+                             precision_threshold=args.precision_threshold,
+                             engine=args.engine, use_cache=args.cache or args.cache_dir is not None,
+                             cache_dir=args.cache_dir)
+    except ValueError as e:
+        print(f"Error: {e}")
+        return
     
     print(f"\nProcessing GPX files...")
     print(f"Alignment point: {lat}, {lon}")
@@ -311,4 +1393,5 @@ def main():
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
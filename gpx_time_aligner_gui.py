@@ -14,7 +14,10 @@ and core alignment functionality for batch processing GPS track files.
 
 @section requirements Requirements
 - Python 3.7+
-- gpxpy library (pip install gpxpy)
+- gpxpy library (pip install gpxpy), unless both numpy and lxml are installed
+- numpy (optional, pip install numpy) for vectorized distance calculations
+- numba (optional, pip install numba) for a compiled distance search kernel
+- lxml (optional, pip install lxml) for fast streaming reads of GPX files
 - tkinter (usually included with Python)
 
 @section usage Usage
@@ -29,23 +32,419 @@ python gpx_aligner.py
 - Time offset calculations and display
 """
 
+import hashlib
 import os
-import sys
-import glob
+import re
+import shelve
+import shutil
+import importlib.util
+import queue
 import threading
-from datetime import datetime, timedelta
-from typing import List, Tuple, Optional
+import multiprocessing
+from collections import deque
+from concurrent.futures import Executor, Future, ProcessPoolExecutor, ThreadPoolExecutor
+from dataclasses import dataclass
+from datetime import datetime, timedelta, timezone
+from functools import partial
+from typing import List, Tuple, Optional, Union
 import math
 import tkinter as tk
 from tkinter import ttk, filedialog, messagebox, scrolledtext
 
 try:
-    import gpxpy
-    import gpxpy.gpx
+    import numpy as np
+except ImportError:
+    np = None
+
+try:
+    from numba import config as numba_config, njit, prange, get_num_threads, set_num_threads
+except ImportError:
+    njit = None
+    prange = range
+else:
+    # Numba's TBB threading layer hangs the interpreter at exit when it was started in a
+    # thread other than the main one (the GUI's alignment thread) or before forking
+    # worker processes. The workqueue layer has neither problem, and the parallel kernel
+    # is never entered from two threads at once
+    if numba_config.THREADING_LAYER == 'default':
+        numba_config.THREADING_LAYER = 'workqueue'
+
+try:
+    from lxml import etree
 except ImportError:
-    messagebox.showerror("Missing Dependency", 
-                        "gpxpy library is required.\n\nInstall it with: pip install gpxpy")
-    sys.exit(1)
+    etree = None
+
+# Parser shared by every lxml parse: GPX files need neither entity expansion nor
+# network access, so both are switched off
+_XML_PARSER = etree.XMLParser(resolve_entities=False, no_network=True) if etree is not None else None
+
+# <time> elements in raw GPX bytes; re.split() with it yields the text between them and,
+# at every fourth position starting from 2, the timestamp texts
+_TIME_ELEMENT_RE = re.compile(rb'(<time>)([^<]*)(</time>)')
+
+# XML declaration at the start of raw GPX bytes, after an optional UTF-8 byte order mark
+_XML_DECLARATION_RE = re.compile(rb'(?:\xef\xbb\xbf)?<\?xml[^>]*\?>')
+
+# Byte sequences that could hold a literal <trk> or <time> that is not markup: comments,
+# CDATA sections and, after the XML declaration, processing instructions. None may
+# appear before the last </trk>
+_UNSAFE_DOCUMENT_MARKERS = (b'<!--', b'<![CDATA[', b'<?')
+
+# Byte sequences inside a <trk> that could add a <time> that is not a track point
+# timestamp: extension elements from another namespace
+_UNSAFE_TRACK_MARKERS = (b'xmlns', b':time')
+
+# GPX timestamps that datetime.fromisoformat() rejects on older Pythons, e.g. with more
+# than six fractional digits or an offset without a colon
+_GPX_TIME_RE = re.compile(r'(\d{4})-(\d{1,2})-(\d{1,2})[T ](\d{1,2}):(\d{1,2}):(\d{1,2})'
+                          r'(?:[.,](\d+))?(?:([+-])(\d{2}):?(\d{2})?)?')
+
+EARTH_RADIUS_M = 6371000.0  # Earth's radius in meters
+
+# Degrees to radians; multiplying by it skips a math.radians() call in pure-Python loops
+_DEG2RAD = math.pi / 180.0
+
+# Largest search radius for which the equirectangular approximation is used
+EQUIRECTANGULAR_MAX_RADIUS_M = 10000.0
+
+# Total size of source files whose parsed form may be kept between the two passes
+PARSED_CACHE_LIMIT_BYTES = 256 * 1024 * 1024
+
+# Files larger than this are always streamed during analysis and parsed again when written
+PARSED_CACHE_MAX_FILE_BYTES = 50 * 1024 * 1024
+
+# Total input size below which files are processed without worker processes when
+# max_workers is not set: starting the pool (and importing NumPy/Numba in every
+# worker) takes longer than a small batch
+PARALLEL_MIN_TOTAL_BYTES = 16 * 1024 * 1024
+
+# Smallest track for which the closest-point search is split across Numba threads
+PARALLEL_KERNEL_MIN_POINTS = 200000
+
+# Threads writing output files when files are shifted sequentially: several writes in
+# flight hide per-file latency on slow or network-mounted output folders
+WRITER_THREADS = 4
+
+# Name of the file caching analysis results between runs, and the folder it is kept in
+# unless GPXAligner is given a cache_dir
+ANALYSIS_CACHE_NAME = '.gpx_align_cache'
+DEFAULT_CACHE_DIR = os.path.join(os.environ.get('XDG_CACHE_HOME') or
+                                 os.path.join(os.path.expanduser('~'), '.cache'),
+                                 'gpx_time_aligner')
+
+# Interval at which queued progress messages are appended to the results area
+LOG_FLUSH_INTERVAL_MS = 50
+
+
+def _closest_point_kernel(lats, lons, lat0, lon0, cos_lat0, dlat_max, dlon_max, max_key,
+                          threshold_key, haversine):
+    """
+    @brief Find the index of the closest point within a radius (Numba kernel)
+    
+    @param lats Float64 array of point latitudes in decimal degrees
+    @param lons Float64 array of point longitudes in decimal degrees
+    @param lat0 Latitude of the alignment point in decimal degrees
+    @param lon0 Longitude of the alignment point in decimal degrees
+    @param cos_lat0 Cosine of the alignment point latitude
+    @param dlat_max Half-height of the search bounding box in degrees of latitude
+    @param dlon_max Half-width of the search bounding box in degrees of longitude
+    @param max_key Search radius as a comparison key, see GPXAligner._distance_key()
+    @param threshold_key Stop at the first point whose key is below this value
+    @param haversine If True, rank points by the Haversine term a; otherwise by the
+                     squared angular distance of the equirectangular approximation
+    
+    @return Tuple of (index, key); index is -1 if no point lies within the radius
+    
+    @details Single fused loop that rejects points outside the bounding box before
+    computing a comparison key (see GPXAligner._distance_key()), so no square root or
+    inverse trigonometric function is evaluated per point. Compiled with numba.njit when
+    Numba is installed; never called otherwise.
+    """
+    best_index = -1
+    best_key = 1e30
+    
+    for i in range(lats.size):
+        dlat = lats[i] - lat0
+        if abs(dlat) > dlat_max:
+            continue
+        dlon = (lons[i] - lon0 + 180.0) % 360.0 - 180.0
+        if abs(dlon) > dlon_max:
+            continue
+        
+        if haversine:
+            s_lat = math.sin(math.radians(dlat) * 0.5)
+            s_lon = math.sin(math.radians(dlon) * 0.5)
+            key = s_lat * s_lat + cos_lat0 * math.cos(math.radians(lats[i])) * s_lon * s_lon
+        else:
+            x = math.radians(dlon) * cos_lat0
+            y = math.radians(dlat)
+            key = x * x + y * y
+        
+        if key <= max_key and key < best_key:
+            best_key = key
+            best_index = i
+            if best_key < threshold_key:
+                break
+    
+    return best_index, best_key
+
+
+if njit is not None:
+    _closest_point_kernel = njit(cache=True, fastmath=True)(_closest_point_kernel)
+
+
+def _closest_point_kernel_parallel(lats, lons, lat0, lon0, cos_lat0, dlat_max, dlon_max,
+                                   max_key, threshold_key, haversine, num_chunks):
+    """
+    @brief Multi-threaded version of _closest_point_kernel() (Numba kernel)
+    
+    @param lats Float64 array of point latitudes in decimal degrees
+    @param lons Float64 array of point longitudes in decimal degrees
+    @param lat0 Latitude of the alignment point in decimal degrees
+    @param lon0 Longitude of the alignment point in decimal degrees
+    @param cos_lat0 Cosine of the alignment point latitude
+    @param dlat_max Half-height of the search bounding box in degrees of latitude
+    @param dlon_max Half-width of the search bounding box in degrees of longitude
+    @param max_key Search radius as a comparison key, see GPXAligner._distance_key()
+    @param threshold_key Accept the first point whose key is below this value
+    @param haversine Rank points by the Haversine term instead of the equirectangular key
+    @param num_chunks Number of contiguous chunks searched in parallel
+    
+    @return Same tuple as _closest_point_kernel()
+    
+    @details Each chunk is scanned by _closest_point_kernel() in a prange loop, then
+    the per-chunk results are reduced in order: the first chunk that stopped under the
+    precision threshold wins, otherwise the closest point overall (lowest index on
+    ties). This returns exactly what the sequential kernel would.
+    """
+    n = lats.size
+    chunk_size = (n + num_chunks - 1) // num_chunks
+    chunk_indices = np.full(num_chunks, -1, dtype=np.int64)
+    chunk_keys = np.full(num_chunks, 1e30)
+    
+    for c in prange(num_chunks):
+        start = c * chunk_size
+        stop = min(start + chunk_size, n)
+        if start < stop:
+            i, key = _closest_point_kernel(
+                lats[start:stop], lons[start:stop], lat0, lon0, cos_lat0,
+                dlat_max, dlon_max, max_key, threshold_key, haversine
+            )
+            if i >= 0:
+                chunk_indices[c] = start + i
+                chunk_keys[c] = key
+    
+    best_index = -1
+    best_key = 1e30
+    for c in range(num_chunks):
+        if chunk_indices[c] < 0:
+            continue
+        if chunk_keys[c] < threshold_key:
+            return chunk_indices[c], chunk_keys[c]
+        if chunk_keys[c] < best_key:
+            best_key = chunk_keys[c]
+            best_index = chunk_indices[c]
+    
+    return best_index, best_key
+
+
+if njit is not None:
+    _closest_point_kernel_parallel = njit(cache=True, fastmath=True, parallel=True)(
+        _closest_point_kernel_parallel
+    )
+
+
+def _parse_gpx_time(text: str) -> datetime:
+    """
+    @brief Parse a GPX <time> string into a datetime
+    
+    @param text ISO 8601 timestamp text, e.g. "2024-05-01T10:00:00Z"
+    
+    @return Parsed datetime (timezone-aware when the text carries an offset or 'Z')
+    
+    @throws ValueError If the text is not a GPX timestamp
+    
+    @details Uses datetime.fromisoformat() for the common GPX formats and falls back to
+    _GPX_TIME_RE for what older Pythons reject (more than six fractional digits, offsets
+    without a colon), so the fast engine never needs gpxpy.
+    """
+    text = text.strip()
+    if text.endswith('Z'):
+        text = text[:-1] + '+00:00'
+    
+    try:
+        return datetime.fromisoformat(text)
+    except ValueError:
+        pass
+    
+    match = _GPX_TIME_RE.fullmatch(text)
+    if match is None:
+        raise ValueError(f"Unrecognized GPX timestamp: {text!r}")
+    
+    year, month, day, hour, minute, second, fraction, sign, off_hours, off_minutes = match.groups()
+    tzinfo = None
+    if sign:
+        offset = timedelta(hours=int(off_hours), minutes=int(off_minutes or 0))
+        tzinfo = timezone(-offset if sign == '-' else offset)
+    microsecond = int((fraction or '0')[:6].ljust(6, '0'))
+    
+    return datetime(int(year), int(month), int(day), int(hour), int(minute), int(second),
+                    microsecond, tzinfo)
+
+
+def _format_gpx_time(value: datetime) -> str:
+    """
+    @brief Format a datetime as a GPX <time> string
+    
+    @param value Datetime to format
+    
+    @return ISO 8601 text, using the 'Z' suffix for UTC
+    """
+    text = value.isoformat()
+    if text.endswith('+00:00'):
+        text = text[:-6] + 'Z'
+    return text
+
+
+def _close_analysis_cache(analysis_cache) -> None:
+    """
+    @brief Close an analysis cache opened by GPXAligner._open_analysis_cache()
+    
+    @param analysis_cache Open shelve to close
+    
+    @details Errors are ignored: the cache only saves time and must not fail a run.
+    """
+    try:
+        analysis_cache.close()
+    except Exception:
+        pass
+
+
+def _find_gpx_files(folder: str) -> List[str]:
+    """
+    @brief List the GPX files in a folder
+    
+    @param folder Folder to search (not recursive)
+    
+    @return Full paths of the files, sorted
+    
+    @details Scans the folder once with os.scandir() and matches the .gpx extension in any
+    letter case. As with glob.glob(), hidden files are skipped and a missing or
+    unreadable folder yields an empty list.
+    """
+    try:
+        with os.scandir(folder) as entries:
+            return sorted(entry.path for entry in entries
+                          if entry.name.lower().endswith('.gpx')
+                          and not entry.name.startswith('.') and entry.is_file())
+    except OSError:
+        return []
+
+
+def _parse_gpx_file(filepath: str):
+    """
+    @brief Parse a GPX file into a gpxpy object
+    
+    @param filepath Full path to the GPX file
+    
+    @return Parsed gpxpy GPX object
+    
+    @details The file is read as bytes and handed to gpxpy, which decodes it once,
+    instead of going through Python's text-mode decoder first. lxml code paths do not
+    use this: they pass the file name to libxml2, which reads the bytes natively.
+    """
+    # Imported here so the fast engine never pays for loading gpxpy
+    import gpxpy
+    
+    with open(filepath, 'rb') as gpx_file:
+        return gpxpy.parse(gpx_file.read())
+
+
+def _write_output(output_path: str, data: bytes):
+    """
+    @brief Write serialized GPX data to a file
+    
+    @param output_path Full path of the file to write
+    @param data Complete file contents
+    """
+    with open(output_path, 'wb') as output_file:
+        output_file.write(data)
+
+
+def _copy_unshifted(filepath: str, output_path: str):
+    """
+    @brief Save a file whose time offset is zero by copying it unchanged
+    
+    @param filepath Full path to the source GPX file
+    @param output_path Full path of the aligned file to write
+    
+    @details Shifting by zero would parse and re-serialize the file only to reproduce
+    its contents. If output_path is filepath itself, the file is left as it is.
+    """
+    try:
+        shutil.copyfile(filepath, output_path)
+    except shutil.SameFileError:
+        pass
+
+
+def _lxml_output_options(document) -> dict:
+    """
+    @brief Serialization options that repeat an lxml document's original XML declaration
+    
+    @param document Parsed lxml ElementTree
+    
+    @return Keyword arguments for etree.tostring() and ElementTree.write()
+    
+    @details lxml reports a missing standalone declaration as False, so only an explicit
+    standalone="yes" is written back.
+    """
+    docinfo = document.docinfo
+    return dict(xml_declaration=True, encoding=docinfo.encoding or 'UTF-8',
+                standalone=True if docinfo.standalone else None)
+
+
+@dataclass
+class TrackArrays:
+    """
+    @brief Timestamped track points of one GPX file as a struct of arrays
+    
+    @details Each point is stored at the same position in every field, so the distance
+    search runs over contiguous float64 arrays instead of chasing gpxpy point objects
+    across the heap. Points without a timestamp are left out.
+    - lats: float64 array of latitudes in decimal degrees
+    - lons: float64 array of longitudes in decimal degrees
+    - times: timestamp of each point, either a datetime or the raw GPX <time> text;
+      use time_at() to get a datetime
+    - index: (N, 3) integer array of (track_index, segment_index, point_index) locating
+      each point in the source document, or None when the points were read without it
+    """
+    lats: 'np.ndarray'
+    lons: 'np.ndarray'
+    times: List[Union[datetime, str]]
+    index: Optional['np.ndarray'] = None
+    
+    def __len__(self) -> int:
+        return self.lats.size
+    
+    def time_at(self, i: int) -> datetime:
+        """
+        @brief Timestamp of point i as a datetime, parsing it if it is still text
+        
+        @param i Position of the point in the arrays
+        
+        @return Timestamp of the point
+        """
+        value = self.times[i]
+        return _parse_gpx_time(value) if isinstance(value, str) else value
+    
+    def bounds(self) -> Tuple[float, float, float, float]:
+        """
+        @brief Bounding box of the points
+        
+        @return Tuple of (min_lat, max_lat, min_lon, max_lon); the track must not be empty
+        """
+        return (float(self.lats.min()), float(self.lats.max()),
+                float(self.lons.min()), float(self.lons.max()))
 
 
 class GPXAligner:
@@ -57,21 +456,80 @@ class GPXAligner:
     timestamps so all tracks reach that point at the same time.
     """
     
-    def __init__(self, alignment_lat: float, alignment_lon: float, radius_meters: float):
+    def __init__(self, alignment_lat: float, alignment_lon: float, radius_meters: float,
+                 low_memory: bool = False, max_workers: Optional[int] = None,
+                 precision_threshold: float = 0.0, engine: Optional[str] = None,
+                 use_cache: bool = False, cache_dir: Optional[str] = None):
         """
         @brief Initialize the GPX aligner with alignment parameters
         
         @param alignment_lat Latitude of the alignment point in decimal degrees (-90 to 90)
         @param alignment_lon Longitude of the alignment point in decimal degrees (-180 to 180)
         @param radius_meters Search radius in meters around the alignment point (must be > 0)
+        @param low_memory If True, never keep parsed files between the analysis and write
+                          passes; files are streamed during analysis and parsed again
+                          when written (default: False)
+        @param max_workers Number of worker processes used to analyze and write files;
+                           None uses one per CPU once the files total at least
+                           PARALLEL_MIN_TOTAL_BYTES and 1 disables multiprocessing
+                           (default: None)
+        @param precision_threshold Distance in meters below which a point is accepted
+                                   without scanning the rest of the track; 0 always
+                                   finds the closest point (default: 0)
+        @param engine 'fast' to read and write files with lxml and NumPy, 'gpxpy' to use
+                      gpxpy, or None for 'fast' when lxml and NumPy are installed
+                      (default: None)
+        @param use_cache If True, remember each file's analysis result and reuse it on
+                         later runs while the file and the alignment settings are
+                         unchanged (default: False)
+        @param cache_dir Folder the analysis cache is stored in when use_cache is set;
+                         None uses DEFAULT_CACHE_DIR (default: None)
+        
+        @throws ValueError If the engine is unknown or its dependencies are missing
         
         @details Creates a new GPXAligner instance configured with the specified alignment
         point and search radius. The reference time will be determined during processing.
+        
+        @note With a non-zero precision threshold the matched point is "good enough"
+        rather than provably the closest: on a track passing the alignment point several
+        times, an earlier pass within the threshold wins over a closer later one.
         """
         self.alignment_lat = alignment_lat
         self.alignment_lon = alignment_lon
         self.radius_meters = radius_meters
+        self.low_memory = low_memory
+        self.max_workers = max_workers
+        self.precision_threshold = precision_threshold
+        
+        if engine is None:
+            engine = 'fast' if etree is not None and np is not None else 'gpxpy'
+        if engine == 'fast':
+            if etree is None or np is None:
+                raise ValueError("The fast engine requires lxml and NumPy "
+                                 "(pip install lxml numpy)")
+        elif engine == 'gpxpy':
+            if importlib.util.find_spec('gpxpy') is None:
+                raise ValueError("gpxpy library is required. Install it with: pip install gpxpy")
+        else:
+            raise ValueError(f"Unknown engine: {engine}")
+        self.engine = engine
+        self.use_cache = use_cache
+        self.cache_dir = cache_dir
         self.reference_time = None
+        
+        # Alignment point constants reused by every distance calculation
+        self._lat0_rad = math.radians(alignment_lat)
+        self._lon0_rad = math.radians(alignment_lon)
+        self._cos_lat0 = math.cos(self._lat0_rad)
+        
+        # Bounding box (in degrees) containing every point within the search radius
+        angular_radius = radius_meters / EARTH_RADIUS_M
+        self._dlat_max = math.degrees(angular_radius)
+        if angular_radius < math.pi / 2 and math.sin(angular_radius) < self._cos_lat0:
+            self._dlon_max = math.degrees(math.asin(math.sin(angular_radius) / self._cos_lat0))
+        else:
+            # The search circle reaches a pole, so every longitude qualifies
+            self._dlon_max = 180.0
     
     def haversine_distance(self, lat1: float, lon1: float, lat2: float, lon2: float) -> float:
         """
@@ -94,17 +552,130 @@ class GPXAligner:
         """
         R = 6371000  # Earth's radius in meters
         
-        lat1_rad = math.radians(lat1)
-        lat2_rad = math.radians(lat2)
-        delta_lat = math.radians(lat2 - lat1)
-        delta_lon = math.radians(lon2 - lon1)
+        lat1_rad = lat1 * _DEG2RAD
+        lat2_rad = lat2 * _DEG2RAD
+        delta_lat = (lat2 - lat1) * _DEG2RAD
+        delta_lon = (lon2 - lon1) * _DEG2RAD
         
-        a = (math.sin(delta_lat / 2) ** 2 + 
-             math.cos(lat1_rad) * math.cos(lat2_rad) * math.sin(delta_lon / 2) ** 2)
-        c = 2 * math.atan2(math.sqrt(a), math.sqrt(1 - a))
+        s_lat = math.sin(delta_lat * 0.5)
+        s_lon = math.sin(delta_lon * 0.5)
+        a = s_lat * s_lat + math.cos(lat1_rad) * math.cos(lat2_rad) * s_lon * s_lon
+        c = 2 * math.asin(math.sqrt(min(a, 1.0)))
         
         return R * c
     
+    def haversine_from_alignment(self, lat: float, lon: float) -> float:
+        """
+        @brief Calculate the Haversine distance from the alignment point to another point
+        
+        @param lat Latitude of the point in decimal degrees
+        @param lon Longitude of the point in decimal degrees
+        
+        @return Distance between the alignment point and the given point in meters
+        
+        @details Same result as haversine_distance() with the alignment point as the first
+        coordinate, but uses the alignment point's radians and cosine precomputed in
+        __init__ instead of recomputing them on every call.
+        """
+        lat_rad = lat * _DEG2RAD
+        delta_lat = lat_rad - self._lat0_rad
+        delta_lon = lon * _DEG2RAD - self._lon0_rad
+        
+        s_lat = math.sin(delta_lat * 0.5)
+        s_lon = math.sin(delta_lon * 0.5)
+        a = s_lat * s_lat + self._cos_lat0 * math.cos(lat_rad) * s_lon * s_lon
+        c = 2 * math.asin(math.sqrt(min(a, 1.0)))
+        
+        return EARTH_RADIUS_M * c
+    
+    def _equirectangular_key_vector(self, lats, lons):
+        """
+        @brief Squared angular distances (radians squared) in the equirectangular projection
+        
+        @param lats NumPy float64 array of latitudes in decimal degrees
+        @param lons NumPy float64 array of longitudes in decimal degrees
+        
+        @return NumPy float64 array of comparison keys, see _distance_key()
+        """
+        x = np.radians((lons - self.alignment_lon + 180.0) % 360.0 - 180.0) * self._cos_lat0
+        y = np.radians(lats - self.alignment_lat)
+        
+        return x * x + y * y
+    
+    def _haversine_key_vector(self, lats, lons):
+        """
+        @brief The Haversine term 'a' for many points at once
+        
+        @param lats NumPy float64 array of latitudes in decimal degrees
+        @param lons NumPy float64 array of longitudes in decimal degrees
+        
+        @return NumPy float64 array of comparison keys, see _distance_key()
+        """
+        lats_rad = np.radians(lats)
+        delta_lat = lats_rad - self._lat0_rad
+        delta_lon = np.radians(lons) - self._lon0_rad
+        
+        s_lat = np.sin(delta_lat * 0.5)
+        s_lon = np.sin(delta_lon * 0.5)
+        return s_lat * s_lat + self._cos_lat0 * np.cos(lats_rad) * s_lon * s_lon
+    
+    def _distance_key(self, meters: float) -> float:
+        """
+        @brief Convert a distance to the comparison key used by the closest-point search
+        
+        @param meters Distance in meters
+        
+        @return Squared angular distance for radii up to EQUIRECTANGULAR_MAX_RADIUS_M,
+                otherwise the Haversine term a = sin^2(d / 2R)
+        
+        @details Both keys grow monotonically with distance, so points can be compared
+        against the radius and against each other without the square root (and arcsin)
+        needed to turn them into meters. Only the winning point is converted.
+        """
+        if self.radius_meters <= EQUIRECTANGULAR_MAX_RADIUS_M:
+            return (meters / EARTH_RADIUS_M) ** 2
+        
+        return math.sin(min(meters / (2 * EARTH_RADIUS_M), math.pi / 2)) ** 2
+    
+    def _to_soa(self, gpx_data) -> TrackArrays:
+        """
+        @brief Convert the timestamped track points of a gpxpy document to a TrackArrays
+        
+        @param gpx_data Parsed GPX data object containing tracks, segments, and points
+        
+        @return TrackArrays with the index field set
+        
+        @details Each segment's coordinates are read straight into NumPy arrays with
+        numpy.fromiter() and filtered with a has-timestamp mask, so the distance scan can
+        run over contiguous arrays instead of gpxpy point objects and no Python tuple or
+        list entry is built per point.
+        """
+        lats = []
+        lons = []
+        times = []
+        index = []
+        
+        for track_idx, track in enumerate(gpx_data.tracks):
+            for segment_idx, segment in enumerate(track.segments):
+                points = segment.points
+                count = len(points)
+                has_time = np.fromiter((p.time is not None for p in points), dtype=bool, count=count)
+                
+                lats.append(np.fromiter((p.latitude for p in points), dtype=np.float64, count=count)[has_time])
+                lons.append(np.fromiter((p.longitude for p in points), dtype=np.float64, count=count)[has_time])
+                times.extend(p.time for p in points if p.time is not None)
+                
+                segment_index = np.empty((int(has_time.sum()), 3), dtype=np.intp)
+                segment_index[:, 0] = track_idx
+                segment_index[:, 1] = segment_idx
+                segment_index[:, 2] = np.flatnonzero(has_time)
+                index.append(segment_index)
+        
+        if not index:
+            return TrackArrays(np.empty(0), np.empty(0), [], np.empty((0, 3), dtype=np.intp))
+        
+        return TrackArrays(np.concatenate(lats), np.concatenate(lons), times, np.concatenate(index))
+    
     def find_closest_point_in_radius(self, gpx_data) -> Optional[Tuple[int, int, datetime, float]]:
         """
         @brief Find the closest GPS track point to the alignment point within the specified radius
@@ -114,34 +685,153 @@ class GPXAligner:
         @return Tuple containing (track_index, segment_index, point_index, timestamp, distance)
                 or None if no point is found within the radius
         
-        @details Iterates through all tracks, segments, and points in the GPX data to find
-        the point that is closest to the alignment coordinates and within the search radius.
-        Only considers points that have valid timestamps.
+        @details Collects all timestamped points into NumPy arrays and evaluates their
+        distances to the alignment coordinates in a single pass (a compiled Numba kernel
+        if available, otherwise vectorized NumPy), then picks the closest point within the
+        search radius. Falls back to a pure-Python scan when NumPy is not installed.
         
         @note If multiple points are equidistant from the alignment point, the first one
         encountered in the iteration order will be returned.
         
         @throws None - method handles all internal exceptions gracefully
         """
-        closest_distance = float('inf')
+        if np is None:
+            return self._find_closest_point_scalar(gpx_data)
+        
+        track = self._to_soa(gpx_data)
+        if len(track) == 0:
+            return None
+        
+        best, distance = self._closest_index(track.lats, track.lons)
+        if best < 0:
+            return None
+        
+        track_idx, segment_idx, point_idx = (int(i) for i in track.index[best])
+        return (track_idx, segment_idx, point_idx, track.time_at(best), distance)
+    
+    def _closest_index(self, lats, lons) -> Tuple[int, float]:
+        """
+        @brief Locate the closest point within the search radius in coordinate arrays
+        
+        @param lats NumPy float64 array of latitudes
+        @param lons NumPy float64 array of longitudes
+        
+        @return Tuple of (array_index, distance_meters); array_index is -1 if no point
+                lies within the radius
+        
+        @details Points outside the search bounding box are discarded first. The remaining
+        candidates are ranked with the equirectangular approximation, or with the Haversine
+        formula for radii above EQUIRECTANGULAR_MAX_RADIUS_M, in a compiled Numba kernel
+        when available (split across threads for tracks of at least
+        PARALLEL_KERNEL_MIN_POINTS points) and with vectorized NumPy otherwise. The
+        distance returned for the winning point is always the exact Haversine distance.
+        """
+        use_equirectangular = self.radius_meters <= EQUIRECTANGULAR_MAX_RADIUS_M
+        max_key = self._distance_key(self.radius_meters)
+        threshold_key = self._distance_key(self.precision_threshold)
+        
+        if njit is not None:
+            args = (lats, lons, self.alignment_lat, self.alignment_lon, self._cos_lat0,
+                    self._dlat_max, self._dlon_max, max_key, threshold_key,
+                    not use_equirectangular)
+            num_threads = get_num_threads()
+            if lats.size >= PARALLEL_KERNEL_MIN_POINTS and num_threads > 1:
+                best, _ = _closest_point_kernel_parallel(*args, num_threads)
+            else:
+                best, _ = _closest_point_kernel(*args)
+            best = int(best)
+        else:
+            # Only points inside the bounding box need a distance calculation. The
+            # latitude test is cheap and rejects most points, so the longitude wrap-around
+            # is only computed for its survivors
+            candidates = np.flatnonzero(np.abs(lats - self.alignment_lat) <= self._dlat_max)
+            dlons = (lons[candidates] - self.alignment_lon + 180.0) % 360.0 - 180.0
+            candidates = candidates[np.abs(dlons) <= self._dlon_max]
+            if candidates.size == 0:
+                return -1, float('inf')
+            
+            if use_equirectangular:
+                keys = self._equirectangular_key_vector(lats[candidates], lons[candidates])
+            else:
+                keys = self._haversine_key_vector(lats[candidates], lons[candidates])
+            keys = np.where(keys <= max_key, keys, np.inf)
+            
+            # The first point under the precision threshold is what a sequential scan
+            # would stop at; otherwise fall back to the closest point overall
+            close_enough = np.flatnonzero(keys < threshold_key)
+            best = int(close_enough[0]) if close_enough.size else int(np.argmin(keys))
+            best = int(candidates[best]) if np.isfinite(keys[best]) else -1
+        
+        if best < 0:
+            return -1, float('inf')
+        
+        # Report the exact great-circle distance for the winning point only
+        distance = self.haversine_from_alignment(float(lats[best]), float(lons[best]))
+        return best, distance
+    
+    def _find_closest_point_scalar(self, gpx_data) -> Optional[Tuple[int, int, datetime, float]]:
+        """
+        @brief Pure-Python fallback for find_closest_point_in_radius()
+        
+        @param gpx_data Parsed GPX data object containing tracks, segments, and points
+        
+        @return Same tuple as find_closest_point_in_radius(), or None
+        
+        @details Iterates through all tracks, segments, and points one at a time, with
+        the distance formulas inlined and all constants bound to local variables. Used
+        only when NumPy is unavailable.
+        """
+        # Bind everything used per point to locals: in CPython, global and attribute
+        # lookups are a large share of this loop's cost
+        sin, cos, deg2rad = math.sin, math.cos, _DEG2RAD
+        alat, alon, radius = self.alignment_lat, self.alignment_lon, self.radius_meters
+        cos_lat0, dlat_max, dlon_max = self._cos_lat0, self._dlat_max, self._dlon_max
+        max_key = self._distance_key(radius)
+        threshold_key = self._distance_key(self.precision_threshold)
+        use_equirectangular = radius <= EQUIRECTANGULAR_MAX_RADIUS_M
+        
+        closest_key = float('inf')
         closest_info = None
         
         for track_idx, track in enumerate(gpx_data.tracks):
             for segment_idx, segment in enumerate(track.segments):
                 for point_idx, point in enumerate(segment.points):
-                    if point.time is None:
+                    t, la, lo = point.time, point.latitude, point.longitude
+                    if t is None:
                         continue
                     
-                    distance = self.haversine_distance(
-                        self.alignment_lat, self.alignment_lon,
-                        point.latitude, point.longitude
-                    )
+                    # Cheap bounding-box rejection before any distance calculation
+                    dlat = la - alat
+                    if abs(dlat) > dlat_max:
+                        continue
+                    dlon = (lo - alon + 180.0) % 360.0 - 180.0
+                    if abs(dlon) > dlon_max:
+                        continue
                     
-                    if distance <= self.radius_meters and distance < closest_distance:
-                        closest_distance = distance
-                        closest_info = (track_idx, segment_idx, point_idx, point.time, distance)
-        
-        return closest_info
+                    # Inlined comparison keys, see _distance_key()
+                    if use_equirectangular:
+                        x = dlon * deg2rad * cos_lat0
+                        y = dlat * deg2rad
+                        key = x * x + y * y
+                    else:
+                        s_lat = sin(dlat * deg2rad * 0.5)
+                        s_lon = sin(dlon * deg2rad * 0.5)
+                        key = s_lat * s_lat + cos_lat0 * cos(la * deg2rad) * s_lon * s_lon
+                    
+                    if key <= max_key and key < closest_key:
+                        closest_key = key
+                        closest_info = (track_idx, segment_idx, point_idx, t, la, lo)
+                        if key < threshold_key:
+                            # Good enough: skip the rest of the traversal
+                            return (track_idx, segment_idx, point_idx, t,
+                                    self.haversine_from_alignment(la, lo))
+        
+        if closest_info is None:
+            return None
+        
+        # Report the exact great-circle distance for the winning point only
+        track_idx, segment_idx, point_idx, t, la, lo = closest_info
+        return (track_idx, segment_idx, point_idx, t, self.haversine_from_alignment(la, lo))
     
     def adjust_gpx_timing(self, gpx_data, time_offset: timedelta):
         """
@@ -166,6 +856,119 @@ class GPXAligner:
                     if point.time is not None:
                         point.time += time_offset
     
+    def _read_points(self, filepath: str) -> TrackArrays:
+        """
+        @brief Read the track points of a GPX file into coordinate arrays using lxml
+        
+        @param filepath Full path to the GPX file to read
+        
+        @return TrackArrays covering every track point with a timestamp (times kept as
+                raw text, no index field)
+        
+        @details The file is streamed, see _stream_timed_points(), so memory stays flat
+        regardless of file size and the file is never materialized as a gpxpy object graph.
+        """
+        lats = []
+        lons = []
+        times = []
+        
+        for point, time_text in self._stream_timed_points(filepath):
+            if time_text and time_text.strip():
+                lats.append(float(point.get('lat')))
+                lons.append(float(point.get('lon')))
+                # Parsed on demand: only the matched point's time is ever needed
+                times.append(time_text)
+        
+        return TrackArrays(np.array(lats, dtype=np.float64), np.array(lons, dtype=np.float64), times)
+    
+    def _stream_timed_points(self, filepath: str):
+        """
+        @brief Stream the <trkpt> elements of a GPX file together with their <time> text
+        
+        @param filepath Full path to the GPX file to read
+        
+        @return Generator of (trkpt_element, time_text) pairs, one per track point with a
+                <time> element
+        
+        @details Reacts to the end of <time> elements instead of looking each one up from
+        its <trkpt> with findtext(), which is the most expensive step per point. A
+        <time> ends before its parent <trkpt>, so the point is still complete when it is
+        yielded; each <trkpt> and any siblings already handled are freed at the point's
+        own end event, so memory stays flat regardless of file size.
+        """
+        last_point = None
+        for _, elem in etree.iterparse(filepath, events=('end',), tag=('{*}trkpt', '{*}time'),
+                                       resolve_entities=False, no_network=True):
+            if elem.tag.endswith('time'):
+                # Only the first <time> directly inside a <trkpt> counts
+                point = elem.getparent()
+                if point is not last_point and point.tag.rpartition('}')[2] == 'trkpt':
+                    last_point = point
+                    yield point, elem.text
+            else:
+                # Free the processed point and any siblings already handled
+                elem.clear()
+                while elem.getprevious() is not None:
+                    del elem.getparent()[0]
+    
+    def adjust_time_elements(self, time_elements, time_offset: timedelta):
+        """
+        @brief Shift the text of GPX <time> elements by the specified time offset
+        
+        @param time_elements List of lxml <time> elements taken from track points
+        @param time_offset Time offset to add to all timestamps (can be negative)
+        
+        @details lxml counterpart of adjust_gpx_timing(); the texts are shifted by
+        _shift_time_texts().
+        
+        @warning This method modifies the elements in-place.
+        """
+        texts = [elem.text.strip() for elem in time_elements]
+        for elem, text in zip(time_elements, self._shift_time_texts(texts, time_offset)):
+            elem.text = text
+    
+    def _shift_time_texts(self, texts: List[str], time_offset: timedelta) -> List[str]:
+        """
+        @brief Shift GPX timestamp strings by the specified time offset
+        
+        @param texts Timestamps as found in <time> elements, without surrounding whitespace
+        @param time_offset Time offset to add to all timestamps (can be negative)
+        
+        @return Shifted timestamps, in the same order
+        
+        @details When every timestamp is a UTC value ending in 'Z', all of them are parsed
+        into a single datetime64[ns] array, shifted with one vectorized addition and
+        formatted back with numpy.datetime_as_string(), without creating a datetime object
+        per point. Other timestamp forms (explicit offsets, local times) are shifted one at
+        a time so their time zone notation is preserved.
+        
+        @throws ValueError If a timestamp cannot be parsed
+        """
+        shifted_texts = None
+        if all(text.endswith('Z') for text in texts):
+            try:
+                times = np.array([text[:-1] for text in texts], dtype='datetime64[ns]')
+            except ValueError:
+                times = None
+            
+            if times is not None:
+                shifted = times + np.timedelta64(time_offset // timedelta(microseconds=1), 'us')
+                
+                # Keep the output as short as the precision of the values allows
+                shifted_ns = shifted.view(np.int64)
+                if not (shifted_ns % 1000000000).any():
+                    unit = 's'
+                elif not (shifted_ns % 1000000).any():
+                    unit = 'ms'
+                else:
+                    unit = 'us'
+                shifted_texts = [text + 'Z' for text in np.datetime_as_string(shifted, unit=unit)]
+        
+        if shifted_texts is None:
+            shifted_texts = [_format_gpx_time(_parse_gpx_time(text) + time_offset) for text in texts]
+        
+        return shifted_texts
+    
     def process_single_file(self, filepath: str) -> Tuple[bool, str, Optional[datetime]]:
         """
         @brief Process a single GPX file to find its alignment point
@@ -177,7 +980,8 @@ class GPXAligner:
                 - status_message: Human-readable description of the result
                 - alignment_timestamp: datetime when the track passes closest to alignment point, or None
         
-        @details Opens and parses the specified GPX file, then searches for the closest
+        @details Reads the track points of the specified GPX file (streamed with lxml when
+        available, otherwise parsed with gpxpy), then searches for the closest
         point to the alignment coordinates within the search radius. This method is used
         during the analysis phase before actual alignment occurs.
         
@@ -186,21 +990,383 @@ class GPXAligner:
         @note This method only analyzes the file without modifying it. The actual time
         adjustment happens in the align_files method.
         """
+        success, message, alignment_time, _, _ = self._analyze_file(filepath)
+        return success, message, alignment_time
+    
+    def _analyze_file(self, filepath: str, keep_document: bool = False):
+        """
+        @brief Analyze a GPX file and return its parsed form alongside the result
+        
+        @param filepath Full path to the GPX file to process
+        @param keep_document If True, keep the gpxpy object for the write pass; ignored
+                             by the fast engine, whose write pass edits the raw file
+                             (default: False)
+        
+        @return Tuple of (success_flag, status_message, alignment_timestamp, document,
+                bounds) where document is the gpxpy object, or None if it was not kept,
+                and bounds is TrackArrays.bounds() of the file's points, or None with the
+                gpxpy engine or when there are none
+        
+        @details Implementation of process_single_file(). align_files() passes the returned
+        document to _write_aligned_file() to avoid parsing the same file again, and caches
+        the bounds so later runs can skip the file when the search area is elsewhere.
+        """
+        document = None
+        bounds = None
+        
         try:
-            with open(filepath, 'r', encoding='utf-8') as gpx_file:
-                gpx_data = gpxpy.parse(gpx_file)
-            
-            closest_info = self.find_closest_point_in_radius(gpx_data)
+            if self.engine == 'fast':
+                # Fast path: read only the track points, no gpxpy object graph
+                track = self._read_points(filepath)
+                best, distance = self._closest_index(track.lats, track.lons) if len(track) else (-1, 0.0)
+                closest_info = None if best < 0 else (None, None, None, track.time_at(best), distance)
+                if len(track):
+                    bounds = track.bounds()
+            else:
+                gpx_data = _parse_gpx_file(filepath)
+                
+                closest_info = self.find_closest_point_in_radius(gpx_data)
+                if keep_document:
+                    document = gpx_data
             
             if closest_info is None:
-                return False, f"No points found within {self.radius_meters}m of alignment point", None
+                return False, f"No points found within {self.radius_meters}m of alignment point", None, None, bounds
             
             track_idx, segment_idx, point_idx, alignment_time, distance = closest_info
             
-            return True, f"Found alignment point at distance {distance:.1f}m", alignment_time
+            return True, f"Found alignment point at distance {distance:.1f}m", alignment_time, document, bounds
             
         except Exception as e:
-            return False, f"Error processing file: {str(e)}", None
+            return False, f"Error processing file: {str(e)}", None, None, None
+    
+    def _write_aligned_file(self, filepath: str, output_path: str, time_offset: timedelta,
+                            document=None):
+        """
+        @brief Shift the timestamps of one GPX file and save the result
+        
+        @param filepath Full path to the source GPX file
+        @param output_path Full path of the aligned file to write
+        @param time_offset Time offset to add to all track point timestamps
+        @param document Document returned by _analyze_file() for filepath, or None to
+                        splice the new timestamps into the file's bytes (fast engine,
+                        see _splice_aligned_file()) or parse the file here
+        
+        @throws Exception Any parse or I/O error is propagated to the caller
+        
+        @details A zero time_offset copies the file unchanged, see _copy_unshifted(). lxml
+        trees are serialized by libxml2 directly into the output file, without building
+        the whole document as a bytes object first.
+        """
+        if not time_offset:
+            _copy_unshifted(filepath, output_path)
+            return
+        
+        if self.engine == 'fast' and document is None:
+            data = self._splice_aligned_file(filepath, time_offset)
+            if data is not None:
+                _write_output(output_path, data)
+                return
+        
+        document = self._shift_document(filepath, time_offset, document)
+        if self.engine == 'gpxpy':
+            _write_output(output_path, document.to_xml().encode('utf-8'))
+        else:
+            document.write(output_path, **_lxml_output_options(document))
+    
+    def _queue_write(self, writer: ThreadPoolExecutor, filepath: str, output_path: str,
+                     time_offset: timedelta, document=None) -> Future:
+        """
+        @brief Shift one GPX file on the calling thread and queue its output for writing
+        
+        @param writer Thread pool that performs the file writes
+        @param filepath Full path to the source GPX file
+        @param output_path Full path of the aligned file to write
+        @param time_offset Time offset to add to all track point timestamps
+        @param document Document returned by _analyze_file() for filepath, or None
+        
+        @return Future that completes once the file is written; any error, including
+                one raised while shifting the timestamps, is reported through it
+        
+        @details Lets the sequential path shift the next file while the previous one is
+        still being written to disk.
+        """
+        if not time_offset:
+            return writer.submit(_copy_unshifted, filepath, output_path)
+        
+        try:
+            data = self._render_aligned_file(filepath, time_offset, document)
+        except Exception as e:
+            future = Future()
+            future.set_exception(e)
+            return future
+        
+        return writer.submit(_write_output, output_path, data)
+    
+    def _render_aligned_file(self, filepath: str, time_offset: timedelta, document=None) -> bytes:
+        """
+        @brief Shift the timestamps of one GPX file and serialize the result
+        
+        @param filepath Full path to the source GPX file
+        @param time_offset Time offset to add to all track point timestamps
+        @param document Document returned by _analyze_file() for filepath, or None to
+                        parse the file here
+        
+        @return Contents of the aligned file
+        
+        @throws Exception Any parse or I/O error is propagated to the caller
+        """
+        if self.engine == 'fast' and document is None:
+            data = self._splice_aligned_file(filepath, time_offset)
+            if data is not None:
+                return data
+        
+        document = self._shift_document(filepath, time_offset, document)
+        if self.engine == 'gpxpy':
+            return document.to_xml().encode('utf-8')
+        
+        return etree.tostring(document, **_lxml_output_options(document))
+    
+    def _splice_aligned_file(self, filepath: str, time_offset: timedelta) -> Optional[bytes]:
+        """
+        @brief Shift the track point timestamps of a GPX file by editing its raw bytes
+        
+        @param filepath Full path to the source GPX file
+        @param time_offset Time offset to add to all track point timestamps
+        
+        @return Contents of the aligned file, or None if the timestamps cannot be located
+                reliably in the raw bytes
+        
+        @details Outside <extensions> GPX only allows <time> inside a track in its track
+        points, and extension elements belong to another namespace, so every unprefixed
+        <time> element between <trk> and </trk> is a track point timestamp. Each track is
+        split at those elements with _TIME_ELEMENT_RE and only the timestamp texts are
+        replaced; every other byte of the file is copied verbatim and no XML tree is
+        built. Namespace prefixes or declarations inside a track, comments, CDATA or
+        processing instructions anywhere before the last </trk>, <time> tags the pattern
+        does not match, or an encoding that is not ASCII-compatible make this return
+        None, and the caller falls back to parsing the file with lxml.
+        
+        @throws Exception Any I/O or timestamp parse error is propagated to the caller
+        """
+        with open(filepath, 'rb') as gpx_file:
+            data = gpx_file.read()
+        
+        # Every track must open with a plain <trk> for the scan below to see it
+        track_count = data.count(b'<trk>')
+        if (track_count == 0 or data.find(b':trk') != -1 or
+                data.count(b'<trk') - data.count(b'<trkpt') - data.count(b'<trkseg') != track_count):
+            return None
+        
+        # A <trk> inside a comment, CDATA section or processing instruction would open a
+        # track region early and pull waypoint or route times into it
+        declaration = _XML_DECLARATION_RE.match(data)
+        body_start = declaration.end() if declaration else 0
+        last_track_end = data.rfind(b'</trk>')
+        if any(data.find(marker, body_start, last_track_end) != -1
+               for marker in _UNSAFE_DOCUMENT_MARKERS):
+            return None
+        
+        # Outside <extensions> GPX only allows <time> in track points, and extension
+        # elements belong to another namespace, so any <time> left in a track is a track
+        # point timestamp. Each track is split at its <time> elements; the bytes around
+        # the tracks are copied as they are
+        parts = [b'']
+        position = 0
+        start = data.find(b'<trk>')
+        while start != -1:
+            end = data.find(b'</trk>', start)
+            if end == -1 or any(data.find(marker, start, end) != -1
+                                for marker in _UNSAFE_TRACK_MARKERS):
+                return None
+            
+            track_parts = _TIME_ELEMENT_RE.split(data[start:end])
+            if len(track_parts) // 4 != data.count(b'<time', start, end):
+                return None
+            
+            parts[-1] += data[position:start] + track_parts[0]
+            parts.extend(track_parts[1:])
+            position = end
+            start = data.find(b'<trk>', end)
+        parts[-1] += data[position:]
+        
+        try:
+            texts = [text.strip().decode('ascii') for text in parts[2::4]]
+        except UnicodeDecodeError:
+            return None
+        
+        # Blank timestamps are left as they are, like adjust_time_elements() does
+        timed = [i for i, text in enumerate(texts) if text]
+        shifted = self._shift_time_texts([texts[i] for i in timed], time_offset)
+        for i, text in zip(timed, shifted):
+            parts[2 + 4 * i] = text.encode('ascii')
+        
+        return b''.join(parts)
+    
+    def _shift_document(self, filepath: str, time_offset: timedelta, document=None):
+        """
+        @brief Shift the timestamps of one parsed GPX file
+        
+        @param filepath Full path to the source GPX file
+        @param time_offset Time offset to add to all track point timestamps
+        @param document Document returned by _analyze_file() for filepath, or None to
+                        parse the file here
+        
+        @return The shifted lxml ElementTree or gpxpy GPX object
+        
+        @details With the fast engine (the default when lxml and NumPy are installed) only the
+        track point <time> elements are rewritten, see adjust_time_elements(), so the rest
+        of the document is kept unchanged when it is serialized by lxml with the original
+        encoding and standalone flag. gpxpy objects are shifted with adjust_gpx_timing()
+        and re-serialized with to_xml().
+        
+        @throws Exception Any parse error is propagated to the caller
+        """
+        if self.engine == 'gpxpy':
+            if document is None:
+                document = _parse_gpx_file(filepath)
+            self.adjust_gpx_timing(document, time_offset)
+            return document
+        
+        # lxml tree: patch the non-blank track point <time> elements in place
+        tree = etree.parse(filepath, _XML_PARSER)
+        time_elements = [elem for elem in tree.iterfind('.//{*}trkpt/{*}time')
+                         if elem.text and elem.text.strip()]
+        self.adjust_time_elements(time_elements, time_offset)
+        return tree
+    
+    def _open_analysis_cache(self):
+        """
+        @brief Open the persistent cache of analysis results
+        
+        @return The open shelve, or None if caching is disabled or the cache cannot be
+                opened
+        
+        @details The cache is stored as ANALYSIS_CACHE_NAME in cache_dir, or in
+        DEFAULT_CACHE_DIR when cache_dir is None. It only saves time, so any error opening
+        it makes the run proceed without it instead of failing.
+        """
+        if not self.use_cache:
+            return None
+        
+        cache_dir = self.cache_dir or DEFAULT_CACHE_DIR
+        try:
+            os.makedirs(cache_dir, exist_ok=True)
+            return shelve.open(os.path.join(cache_dir, ANALYSIS_CACHE_NAME))
+        except Exception:
+            return None
+    
+    def _analysis_cache_key(self, filepath: str, bounds: bool = False) -> Optional[str]:
+        """
+        @brief Compute the analysis cache key of a file
+        
+        @param filepath Full path to the GPX file
+        @param bounds If True, return the key of the file's point bounds instead of its
+                      analysis result (default: False)
+        
+        @return Hex digest identifying the file's current contents and the alignment
+                settings, or None if the file cannot be stat'ed
+        
+        @details The key covers the file's path, modification time and size, and every
+        setting that affects which point is matched (alignment point, radius, precision
+        threshold and engine), so editing the file or changing a setting is a miss. The
+        bounds key leaves out the settings, since the bounds depend on the file alone.
+        """
+        try:
+            stat = os.stat(filepath)
+        except OSError:
+            return None
+        
+        key = (os.path.abspath(filepath), stat.st_mtime_ns, stat.st_size)
+        if bounds:
+            key += ('bounds',)
+        else:
+            key += (self.alignment_lat, self.alignment_lon, self.radius_meters,
+                    self.precision_threshold, self.engine)
+        return hashlib.blake2b(repr(key).encode('utf-8'), digest_size=16).hexdigest()
+    
+    def _bounds_in_search_area(self, bounds: Tuple[float, float, float, float]) -> bool:
+        """
+        @brief Check whether a file's points can lie within the search radius
+        
+        @param bounds Bounding box of the file's points, see TrackArrays.bounds()
+        
+        @return False if no point inside bounds passes the bounding-box test of the
+                closest-point search, so the file cannot have a point within the radius
+        
+        @details The longitude range is also compared with the search interval shifted
+        by a full turn either way, which covers search areas crossing the antimeridian.
+        """
+        min_lat, max_lat, min_lon, max_lon = bounds
+        if (min_lat - self.alignment_lat > self._dlat_max or
+                self.alignment_lat - max_lat > self._dlat_max):
+            return False
+        if self._dlon_max >= 180.0:
+            return True
+        
+        west = self.alignment_lon - self._dlon_max
+        east = self.alignment_lon + self._dlon_max
+        return any(min_lon <= east + shift and max_lon >= west + shift
+                   for shift in (-360.0, 0.0, 360.0))
+    
+    def _fits_parsed_cache(self, filepath: str, cached_bytes: int) -> bool:
+        """
+        @brief Decide whether a file's parsed document should be kept for the write pass
+        
+        @param filepath Full path to the GPX file
+        @param cached_bytes Total size of the source files already kept
+        
+        @return False with the fast engine, whose write pass edits the raw file instead,
+                in low-memory mode, for files over PARSED_CACHE_MAX_FILE_BYTES, and once
+                keeping the file would exceed PARSED_CACHE_LIMIT_BYTES
+        """
+        if self.low_memory or self.engine == 'fast':
+            return False
+        
+        file_size = os.path.getsize(filepath)
+        return (file_size <= PARSED_CACHE_MAX_FILE_BYTES and
+                cached_bytes + file_size <= PARSED_CACHE_LIMIT_BYTES)
+    
+    def _worker_count(self, num_files: int) -> int:
+        """
+        @brief Number of worker processes to use for a batch of files
+        
+        @param num_files Number of GPX files to be processed
+        
+        @return max_workers (or the CPU count when unset), capped at num_files
+        """
+        return min(self.max_workers or os.cpu_count() or 1, num_files)
+    
+    def _create_executor(self, gpx_files: List[str]) -> Optional[Executor]:
+        """
+        @brief Create the process pool used for per-file work
+        
+        @param gpx_files Paths of the GPX files to be processed
+        
+        @return Executor, or None when the work should run serially (a single
+                file, max_workers of 1, or with max_workers unset, a batch smaller than
+                PARALLEL_MIN_TOTAL_BYTES)
+        
+        @details Each worker receives a copy of this aligner once, through the pool
+        initializer, instead of with every task. Where worker processes cannot be
+        started, a ThreadPoolExecutor with the same initializer is returned instead.
+        """
+        workers = self._worker_count(len(gpx_files))
+        if workers <= 1:
+            return None
+        
+        if self.max_workers is None:
+            total_bytes = sum(os.path.getsize(filepath) for filepath in gpx_files)
+            if total_bytes < PARALLEL_MIN_TOTAL_BYTES:
+                return None
+        
+        try:
+            return ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                       initargs=(self,))
+        except (ImportError, NotImplementedError, OSError):
+            # No working multiprocessing (e.g. no sem_open in some sandboxes); threads still
+            # overlap file I/O and lxml parsing, which releases the GIL
+            return ThreadPoolExecutor(max_workers=workers, initializer=_init_worker,
+                                      initargs=(self,))
     
     def align_files(self, input_folder: str, output_folder: str, progress_callback=None) -> dict:
         """
@@ -230,14 +1396,7 @@ class GPXAligner:
         @throws Returns error information in result dictionary rather than raising exceptions
         """
         # Find all GPX files
-        gpx_patterns = [
-            os.path.join(input_folder, '*.gpx'),
-            os.path.join(input_folder, '*.GPX')
-        ]
-        
-        gpx_files = []
-        for pattern in gpx_patterns:
-            gpx_files.extend(glob.glob(pattern))
+        gpx_files = _find_gpx_files(input_folder)
         
         if not gpx_files:
             return {'error': 'No GPX files found in the specified folder'}
@@ -247,32 +1406,102 @@ class GPXAligner:
         
         # First pass: find alignment times for all files
         file_info = {}
-        alignment_times = []
+        reference_time = None
+        cached_bytes = 0
         
-        for i, filepath in enumerate(gpx_files):
-            filename = os.path.basename(filepath)
-            if progress_callback:
-                progress_callback(f"Analyzing {filename}...\n")
-            
-            success, message, alignment_time = self.process_single_file(filepath)
-            file_info[filepath] = {
-                'success': success,
-                'message': message,
-                'alignment_time': alignment_time,
-                'filename': filename
-            }
+        # Files unchanged since an earlier run with the same settings are not analyzed
+        # again, nor are unchanged files whose points all lie outside the search area
+        analysis_cache = self._open_analysis_cache()
+        executor = None
+        try:
+            cache_keys = {}
+            bounds_keys = {}
+            cached_results = {}
+            if analysis_cache is not None:
+                for filepath in gpx_files:
+                    cache_keys[filepath] = key = self._analysis_cache_key(filepath)
+                    entry = analysis_cache.get(key) if key is not None else None
+                    if entry is not None:
+                        message, alignment_time = entry
+                        cached_results[filepath] = (True, f"{message} (cached)", alignment_time,
+                                                    None, None)
+                        continue
+                    
+                    bounds_keys[filepath] = key = self._analysis_cache_key(filepath, bounds=True)
+                    bounds = analysis_cache.get(key) if key is not None else None
+                    if bounds is not None and not self._bounds_in_search_area(bounds):
+                        message = (f"No points found within {self.radius_meters}m of "
+                                   "alignment point (cached)")
+                        cached_results[filepath] = (False, message, None, None, None)
             
-            if success and alignment_time:
-                alignment_times.append(alignment_time)
+            executor = self._create_executor(gpx_files)
+            if executor is None:
+                # Whether a file is kept is decided before parsing it, so files that will not
+                # fit in the cache are streamed instead of being fully parsed and dropped
+                analyses = ((filepath, cached_results.get(filepath) or self._analyze_file(
+                                filepath, keep_document=self._fits_parsed_cache(filepath, cached_bytes)))
+                            for filepath in gpx_files)
+            else:
+                # Two tasks per worker keep the pool busy without queueing the whole folder
+                window = 2 * self._worker_count(len(gpx_files))
+                futures = _submit_bounded(partial(executor.submit, _analyze_in_worker),
+                                          ((filepath,) for filepath in gpx_files
+                                           if filepath not in cached_results), window)
+                analyses = ((filepath, cached_results[filepath] if filepath in cached_results
+                             else _analysis_result(next(futures)))
+                            for filepath in gpx_files)
             
-            if progress_callback:
-                progress_callback(f"  {message}\n")
+            for filepath, (success, message, alignment_time, document, bounds) in analyses:
+                filename = os.path.basename(filepath)
+                if progress_callback:
+                    progress_callback(f"Analyzing {filename}...\n")
+                
+                # The parsed file is kept for the write pass
+                if document is not None:
+                    cached_bytes += os.path.getsize(filepath)
+                
+                file_info[filepath] = {
+                    'success': success,
+                    'message': message,
+                    'alignment_time': alignment_time,
+                    'filename': filename,
+                    'document': document
+                }
+                
+                if analysis_cache is not None and filepath not in cached_results:
+                    try:
+                        if success and cache_keys.get(filepath):
+                            analysis_cache[cache_keys[filepath]] = (message, alignment_time)
+                        if bounds is not None and bounds_keys.get(filepath):
+                            analysis_cache[bounds_keys[filepath]] = bounds
+                    except Exception:
+                        # A cache that cannot be written is dropped for the rest of the run
+                        _close_analysis_cache(analysis_cache)
+                        analysis_cache = None
+                
+                # Track the earliest alignment time as results arrive
+                if success and alignment_time:
+                    if reference_time is None or alignment_time < reference_time:
+                        reference_time = alignment_time
+                
+                if progress_callback:
+                    progress_callback(f"  {message}\n")
+        except BaseException:
+            # The write pass will not run, so the workers are not needed any more
+            if executor is not None:
+                executor.shutdown()
+            raise
+        finally:
+            if analysis_cache is not None:
+                _close_analysis_cache(analysis_cache)
         
-        if not alignment_times:
+        if reference_time is None:
+            if executor is not None:
+                executor.shutdown()
             return {'error': 'No files had points within the specified radius of the alignment point'}
         
         # Use the earliest alignment time as reference
-        self.reference_time = min(alignment_times)
+        self.reference_time = reference_time
         if progress_callback:
             progress_callback(f"\nUsing reference time: {self.reference_time}\n\n")
         
@@ -285,6 +1514,31 @@ class GPXAligner:
             'files': {}
         }
         
+        # Writes run ahead of the loop below, which consumes them in order: in the worker
+        # processes, or else on writer threads so the next file is shifted while earlier
+        # ones are written to disk
+        writer = None
+        if executor is not None:
+            submit = partial(executor.submit, _write_in_worker)
+        else:
+            writer = ThreadPoolExecutor(max_workers=WRITER_THREADS)
+            submit = partial(self._queue_write, writer)
+            # One more than the writers, so each can be busy while the next file is shifted
+            window = WRITER_THREADS + 1
+        
+        # Offsets are computed up front so that building the write arguments cannot fail
+        for info in file_info.values():
+            if info['success']:
+                info['time_offset'] = self.reference_time - info['alignment_time']
+        
+        write_futures = _submit_bounded(
+            submit,
+            ((filepath, os.path.join(output_folder, file_info[filepath]['filename']),
+              file_info[filepath]['time_offset'], file_info[filepath].pop('document', None))
+             for filepath in gpx_files if file_info[filepath]['success']),
+            window
+        )
+        
         for filepath in gpx_files:
             info = file_info[filepath]
             filename = info['filename']
@@ -300,20 +1554,10 @@ class GPXAligner:
                 continue
             
             try:
-                # Load and process the file
-                with open(filepath, 'r', encoding='utf-8') as gpx_file:
-                    gpx_data = gpxpy.parse(gpx_file)
-                
-                # Calculate time offset needed
-                time_offset = self.reference_time - info['alignment_time']
-                
-                # Adjust timing
-                self.adjust_gpx_timing(gpx_data, time_offset)
-                
-                # Save aligned file
+                time_offset = info['time_offset']
                 output_path = os.path.join(output_folder, filename)
-                with open(output_path, 'w', encoding='utf-8') as output_file:
-                    output_file.write(gpx_data.to_xml())
+                
+                next(write_futures).result()
                 
                 results['successful'] += 1
                 results['files'][filename] = {
@@ -335,9 +1579,104 @@ class GPXAligner:
                 if progress_callback:
                     progress_callback(f"Failed to align {filename}: {str(e)}\n")
         
+        if executor is not None:
+            executor.shutdown()
+        if writer is not None:
+            writer.shutdown()
+        
         return results
 
 
+# Aligner used inside process pool workers, set once per worker by _init_worker()
+_worker_aligner = None
+
+
+def _init_worker(aligner: GPXAligner):
+    """
+    @brief Pool initializer storing the aligner configuration in the worker
+    
+    @param aligner GPXAligner whose settings the worker should use
+    """
+    global _worker_aligner
+    _worker_aligner = aligner
+    
+    if njit is not None:
+        # Files are already spread over processes; one Numba thread each avoids oversubscription
+        set_num_threads(1)
+
+
+def _analyze_in_worker(filepath: str):
+    """
+    @brief Run GPXAligner._analyze_file() in a worker process
+    
+    @param filepath Full path to the GPX file to analyze
+    
+    @return Same tuple as GPXAligner._analyze_file(), with document always None so the
+            parsed file is not pickled back to the parent process
+    """
+    return _worker_aligner._analyze_file(filepath)
+
+
+def _analysis_result(future: Future):
+    """
+    @brief Get the result of an _analyze_in_worker() future
+    
+    @param future Future returned by submitting _analyze_in_worker()
+    
+    @return Same tuple as GPXAligner._analyze_file(); an error raised by the worker or
+            the pool (such as BrokenProcessPool) is returned as a failed analysis of
+            that file
+    """
+    try:
+        return future.result()
+    except Exception as e:
+        return False, f"Error processing file: {str(e)}", None, None, None
+
+
+def _write_in_worker(filepath: str, output_path: str, time_offset: timedelta, document=None):
+    """
+    @brief Run GPXAligner._write_aligned_file() in a worker process
+    
+    @param filepath Full path to the source GPX file
+    @param output_path Full path of the aligned file to write
+    @param time_offset Time offset to add to all track point timestamps
+    @param document Parsed document to reuse, or None to parse the file in the worker
+    """
+    _worker_aligner._write_aligned_file(filepath, output_path, time_offset, document)
+
+
+def _submit_bounded(submit, arg_tuples, window: int):
+    """
+    @brief Submit calls to an executor with a bounded number in flight
+    
+    @param submit Callable that starts one call and returns its future, such as
+                  functools.partial(executor.submit, fn)
+    @param arg_tuples Iterable of argument tuples, one per call
+    @param window Maximum number of submitted calls whose future has not been yielded yet
+    
+    @return Generator of futures in the order of arg_tuples
+    
+    @details Arguments are consumed lazily, so a new call is only submitted once the
+    caller has taken an earlier future; this gives backpressure when the caller is
+    slower than the workers. An exception raised by submit is set on that call's
+    future instead of ending the generator, so later calls are still made.
+    """
+    pending = deque()
+    for args in arg_tuples:
+        if len(pending) >= window:
+            yield pending.popleft()
+        try:
+            future = submit(*args)
+        except Exception as e:
+            # Fail this call only (e.g. a broken pool), not the calls after it
+            future = Future()
+            future.set_exception(e)
+        pending.append(future)
+    
+    while pending:
+        yield pending.popleft()
+
+
 class GPXAlignerGUI:
     """
     @brief Tkinter-based graphical user interface for the GPX alignment tool
@@ -374,6 +1713,10 @@ class GPXAlignerGUI:
         self.longitude = tk.DoubleVar(value=-157.7161200)
         self.radius = tk.DoubleVar(value=200.0)
         
+        # Progress messages from the alignment thread, shown by _flush_log(); None marks
+        # the end of a run
+        self._log_queue = queue.Queue()
+        
         self.setup_ui()
     
     def setup_ui(self):
@@ -546,12 +1889,43 @@ class GPXAlignerGUI:
         
         @param message String message to display in the results area
         
-        @details Appends the message to the scrollable text widget and automatically
-        scrolls to show the latest content. Updates the GUI to ensure immediate display.
+        @details Safe to call from the alignment thread: the message is queued and
+        appended to the text widget by _flush_log() on the Tk main loop, batched with
+        any other messages queued in the meantime.
         """
-        self.results_text.insert(tk.END, message)
-        self.results_text.see(tk.END)
-        self.root.update_idletasks()
+        self._log_queue.put(message)
+    
+    def _flush_log(self):
+        """
+        @brief Append all queued progress messages to the results text area
+        
+        @details Inserts the pending messages with a single widget update and scrolls to
+        the end. While an alignment is running it reschedules itself every
+        LOG_FLUSH_INTERVAL_MS milliseconds, so a burst of messages costs one redraw
+        rather than one per line. When it reaches the end-of-run marker queued by
+        run_alignment() it calls finish_alignment() instead, so the alignment thread
+        itself never touches Tk.
+        """
+        messages = []
+        finished = False
+        try:
+            while True:
+                message = self._log_queue.get_nowait()
+                if message is None:
+                    finished = True
+                    break
+                messages.append(message)
+        except queue.Empty:
+            pass
+        
+        if messages:
+            self.results_text.insert(tk.END, ''.join(messages))
+            self.results_text.see(tk.END)
+        
+        if finished:
+            self.finish_alignment()
+        else:
+            self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
     
     def clear_results(self):
         """
@@ -591,15 +1965,29 @@ class GPXAlignerGUI:
         # Clear previous results
         self.clear_results()
         
+        # Show progress messages while the alignment runs
+        self.root.after(LOG_FLUSH_INTERVAL_MS, self._flush_log)
+        
+        # Read the settings here: Tk variables must only be accessed from the main thread
+        settings = (self.latitude.get(), self.longitude.get(), self.radius.get(),
+                    self.input_folder.get(), self.output_folder.get())
+        
         # Start alignment in separate thread
-        alignment_thread = threading.Thread(target=self.run_alignment)
+        alignment_thread = threading.Thread(target=self.run_alignment, args=settings)
         alignment_thread.daemon = True
         alignment_thread.start()
     
-    def run_alignment(self):
+    def run_alignment(self, latitude: float, longitude: float, radius: float,
+                      input_folder: str, output_folder: str):
         """
         @brief Execute the GPX alignment process in a background thread
         
+        @param latitude Alignment point latitude in decimal degrees
+        @param longitude Alignment point longitude in decimal degrees
+        @param radius Search radius in meters
+        @param input_folder Folder containing the GPX files to align
+        @param output_folder Folder the aligned files are written to
+        
         @details This method runs in a separate thread to prevent GUI freezing during
         file processing. It creates a GPXAligner instance, processes all files in the
         input directory, and provides real-time progress updates through the GUI.
@@ -612,21 +2000,21 @@ class GPXAlignerGUI:
         try:
             # Create aligner
             aligner = GPXAligner(
-                self.latitude.get(),
-                self.longitude.get(),
-                self.radius.get()
+                latitude,
+                longitude,
+                radius
             )
             
             self.log_progress(f"Starting GPX file alignment...\n")
-            self.log_progress(f"Alignment point: {self.latitude.get()}, {self.longitude.get()}\n")
-            self.log_progress(f"Search radius: {self.radius.get()}m\n")
-            self.log_progress(f"Input folder: {self.input_folder.get()}\n")
-            self.log_progress(f"Output folder: {self.output_folder.get()}\n\n")
+            self.log_progress(f"Alignment point: {latitude}, {longitude}\n")
+            self.log_progress(f"Search radius: {radius}m\n")
+            self.log_progress(f"Input folder: {input_folder}\n")
+            self.log_progress(f"Output folder: {output_folder}\n\n")
             
             # Process files
             results = aligner.align_files(
-                self.input_folder.get(),
-                self.output_folder.get(),
+                input_folder,
+                output_folder,
                 self.log_progress
             )
             
@@ -644,7 +2032,7 @@ class GPXAlignerGUI:
                 self.log_progress(f"Reference time: {results['reference_time']}\n")
                 
                 if results['successful'] > 0:
-                    self.log_progress(f"\nAligned files saved to: {self.output_folder.get()}\n")
+                    self.log_progress(f"\nAligned files saved to: {output_folder}\n")
                     
                     # Show summary of successful files
                     self.log_progress("\nSuccessfully aligned files:\n")
@@ -662,8 +2050,8 @@ class GPXAlignerGUI:
             self.log_progress(f"\nUnexpected error: {str(e)}\n")
         
         finally:
-            # Re-enable process button and stop progress bar
-            self.root.after(0, self.finish_alignment)
+            # _flush_log() calls finish_alignment() once it reaches this marker
+            self._log_queue.put(None)
     
     def finish_alignment(self):
         """
@@ -671,7 +2059,7 @@ class GPXAlignerGUI:
         
         @details Stops the progress bar animation and re-enables the process button
         to allow for additional alignment operations. This method is called from the
-        main thread to ensure proper GUI updates.
+        main thread, by _flush_log(), after the last progress message has been shown.
         """
         self.progress.stop()
         self.process_btn.config(state="normal")
@@ -698,9 +2086,16 @@ def main():
     elif 'alt' in available_themes:
         style.theme_use('alt')
     
+    if (etree is None or np is None) and importlib.util.find_spec('gpxpy') is None:
+        messagebox.showerror("Missing Dependency",
+                             "gpxpy library is required.\n\nInstall it with: pip install gpxpy")
+        root.destroy()
+        return
+    
     app = GPXAlignerGUI(root)
     root.mainloop()
 
 
 if __name__ == "__main__":
+    multiprocessing.freeze_support()
     main()
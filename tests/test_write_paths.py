@@ -0,0 +1,132 @@
+"""
+Regression tests for the fast engine's write paths.
+
+The byte splice and the lxml fallback must produce files that gpxpy reads back as the
+source file with only the track point <time> values shifted.
+"""
+
+import os
+import sys
+import tempfile
+import unittest
+from datetime import timedelta
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import gpxpy
+
+import gpx_time_aligner
+
+try:
+    import gpx_time_aligner_gui
+except ImportError:  # no tkinter
+    gpx_time_aligner_gui = None
+
+MODULES = [module for module in (gpx_time_aligner, gpx_time_aligner_gui) if module is not None]
+
+OFFSET = timedelta(hours=1, seconds=2.5)
+
+TRACK = """<trk><name>t</name>{extra}
+<trkseg>
+<trkpt lat="20.9706824" lon="-157.8662200"><ele>1.0</ele><time>2024-05-01T10:00:37.123Z</time></trkpt>
+<trkpt lat="20.9708905" lon="-157.8661200"><ele>2.0</ele><time>2024-05-01T10:00:38Z</time></trkpt>
+<trkpt lat="20.9710890" lon="-157.8660200"><ele>3.0</ele></trkpt>
+</trkseg>
+</trk>"""
+
+BODY = """<gpx version="1.1" creator="test" xmlns="http://www.topografix.com/GPX/1/1">
+<metadata>{desc}<time>2024-01-01T00:00:00Z</time></metadata>{comment}
+<wpt lat="21.3" lon="-157.7"><time>2024-01-01T00:00:05Z</time><name>w</name></wpt>
+{track}
+</gpx>"""
+
+DECLARATION = '<?xml version="1.0" encoding="UTF-8"?>\n'
+
+
+def _gpx(declaration=DECLARATION, desc='', comment='', extra='', newline='\n'):
+    """Fixture file contents; the arguments are inserted into BODY and TRACK."""
+    return declaration + BODY.format(desc=desc, comment=comment,
+                                     track=TRACK.format(extra=extra)) + newline
+
+
+# name: (file contents, whether the byte splice can handle it)
+FIXTURES = {
+    'plain': (_gpx(), True),
+    'single_quoted_declaration': (_gpx(declaration="<?xml version='1.0' encoding='UTF-8'?>\n"), True),
+    'no_trailing_newline': (_gpx(newline=''), True),
+    'comment_in_track': (_gpx(extra='<!-- <time>x</time> -->'), False),
+    'cdata_in_track': (_gpx(extra='<desc><![CDATA[a <b>]]></desc>'), False),
+    # A literal <trk> before the real track must not pull the waypoint time into it
+    'trk_in_comment_before_waypoint': (_gpx(comment='<!-- exported <trk> data -->'), False),
+    'trk_in_cdata_before_waypoint': (_gpx(desc='<desc><![CDATA[see <trk>]]></desc>'), False),
+}
+
+def _expected_xml(source_path):
+    """The source file as gpxpy sees it, with its track point times shifted by OFFSET."""
+    with open(source_path, encoding='utf-8') as gpx_file:
+        gpx = gpxpy.parse(gpx_file)
+    for track in gpx.tracks:
+        for segment in track.segments:
+            for point in segment.points:
+                if point.time is not None:
+                    point.time += OFFSET
+    return gpx.to_xml()
+
+
+def _reparsed_xml(path):
+    """A file as gpxpy sees it."""
+    with open(path, encoding='utf-8') as gpx_file:
+        return gpxpy.parse(gpx_file).to_xml()
+
+
+class WritePathTest(unittest.TestCase):
+
+    def setUp(self):
+        self._tmp = tempfile.TemporaryDirectory()
+        self.tmp = self._tmp.name
+
+    def tearDown(self):
+        self._tmp.cleanup()
+
+    def _write_fixture(self, name, contents):
+        path = os.path.join(self.tmp, f"{name}.gpx")
+        with open(path, 'w', encoding='utf-8', newline='') as gpx_file:
+            gpx_file.write(contents)
+        return path
+
+    def test_splice_only_changes_times(self):
+        for module in MODULES:
+            aligner = module.GPXAligner(20.97, -157.87, 100, engine='fast')
+            for name, (contents, spliceable) in FIXTURES.items():
+                with self.subTest(module=module.__name__, fixture=name):
+                    source = self._write_fixture(name, contents)
+                    data = aligner._splice_aligned_file(source, OFFSET)
+                    if not spliceable:
+                        self.assertIsNone(data)
+                        continue
+
+                    output = os.path.join(self.tmp, f"{name}.spliced.gpx")
+                    with open(output, 'wb') as gpx_file:
+                        gpx_file.write(data)
+                    self.assertEqual(_reparsed_xml(output), _expected_xml(source))
+
+                    # Outside the shifted <time> texts the bytes are untouched
+                    expected = contents.replace('10:00:37.123Z', '11:00:39.623Z')
+                    expected = expected.replace('10:00:38Z', '11:00:40.500Z')
+                    self.assertEqual(data.decode('utf-8'), expected)
+
+    def test_fallback_only_changes_times(self):
+        for module in MODULES:
+            aligner = module.GPXAligner(20.97, -157.87, 100, engine='fast')
+            # Force every file through the lxml fallback
+            aligner._splice_aligned_file = lambda filepath, time_offset: None
+            for name, (contents, _) in FIXTURES.items():
+                with self.subTest(module=module.__name__, fixture=name):
+                    source = self._write_fixture(name, contents)
+                    output = os.path.join(self.tmp, f"{name}.parsed.gpx")
+                    aligner._write_aligned_file(source, output, OFFSET)
+                    self.assertEqual(_reparsed_xml(output), _expected_xml(source))
+
+
+if __name__ == '__main__':
+    unittest.main()